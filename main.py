@@ -1,34 +1,49 @@
 import sys
+import time
 import signal
 from PySide6.QtWidgets import QApplication, QSplashScreen
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QPixmap, QIcon, QImageReader
 from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QIcon
-
-from nt.gui import MainWindow
 
 
 def main():
     signal.signal(signal.SIGINT, signal.SIG_DFL)
 
     app = QApplication(sys.argv)
-    app.setWindowIcon(QIcon("assets/icon.png"))
     app.setApplicationName("Axonion")
 
-    splash_pixmap = QPixmap("assets/splash.png")
+    # decode via QImageReader with orientation transforms off; cheaper than
+    # the QPixmap constructor path for the first frame
+    reader = QImageReader("assets/splash.png")
+    reader.setAutoTransform(False)
+    splash_pixmap = QPixmap.fromImage(reader.read())
     splash = QSplashScreen(
         splash_pixmap,
         Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint
     )
+    splash_t0 = time.monotonic()
     splash.show()
+    app.processEvents()  # force the first splash paint before further loading
+
+    app.setWindowIcon(QIcon("assets/icon.png"))
+
+    min_splash_ms = 600  # keep the splash up briefly even on fast boots
 
     def start_main():
+        # imported here so the splash paints before the heavy gui stack loads
+        from nt.gui import MainWindow
+
         window = MainWindow()
         window.resize(1200, 800)
-        window.show()
-        splash.finish(window)
 
-    QTimer.singleShot(1200, start_main)
+        def reveal():
+            window.show()
+            splash.finish(window)
+
+        elapsed_ms = (time.monotonic() - splash_t0) * 1000.0
+        QTimer.singleShot(max(0, int(min_splash_ms - elapsed_ms)), reveal)
+
+    QTimer.singleShot(0, start_main)
 
     sys.exit(app.exec())
 
@@ -0,0 +1,22 @@
+# cython: language_level=3
+# Optional AOT-compiled quantize loop for DAQ. Build in place with:
+#   cythonize -i nt/_daq_native.pyx
+# daq.py falls back to the NumPy/Numba paths when the extension is absent.
+
+cimport cython
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cpdef void quantize_array(double[:] noisy, double min_v, double max_v,
+                          double inv_step, double step_size, double[:] out):
+    cdef Py_ssize_t i, n = noisy.shape[0]
+    cdef double x
+    for i in range(n):
+        x = noisy[i]
+        if x < min_v:
+            x = min_v
+        elif x > max_v:
+            x = max_v
+        out[i] = (<double>(<long long>((x - min_v) * inv_step + 0.5))) * step_size + min_v
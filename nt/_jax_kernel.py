@@ -0,0 +1,131 @@
+"""Optional JAX-compiled population kernel.
+
+step_pop_jax is a pure function over the SoA state arrays: it returns
+new arrays instead of mutating, and jax.jit hands the whole elementwise
+chain to XLA, which fuses it into one compiled pass on whatever backend
+jax was built for (CPU, GPU, TPU). Kills and dead-lane dynamics are
+expressed with where-selects so the function stays branch-free.
+
+The dynamics must stay in sync with nt/neuron.py, nt/population.py and
+nt/_kernels.py. When jax is not installed, NeuronPopulation falls back
+to its numba/numpy paths.
+"""
+
+try:
+    import jax
+    import jax.numpy as jnp
+    HAVE_JAX = True
+except ImportError:
+    HAVE_JAX = False
+
+
+if HAVE_JAX:
+
+    @jax.jit
+    def step_pop_jax(v, prev_v, m, h, n, ATP, mito, Ca,
+                     integrity, damage, health, dead, i_ext, dt_ms, noise):
+        """One dt for a whole population; returns the new state tuple.
+
+        noise is a pre-drawn standard-normal array (the caller owns the
+        RNG); it only reaches dead lanes.
+        """
+        dt_sec = dt_ms / 1000.0
+
+        # rate constants, with the singular bins guarded the same way the
+        # scalar model special-cases v == -40 / v == -55
+        dm = 1.0 - jnp.exp(-(v + 40.0) * 0.1)
+        am = jnp.where(
+            dm == 0.0, 1.0,
+            0.1 * (v + 40.0) / jnp.where(dm == 0.0, 1.0, dm),
+        )
+        bm = 4.0 * jnp.exp(-(v + 65.0) / 18.0)
+        ah = 0.07 * jnp.exp(-(v + 65.0) / 20.0)
+        bh = 1.0 / (1.0 + jnp.exp(-(v + 35.0) * 0.1))
+        dn = 1.0 - jnp.exp(-(v + 55.0) * 0.1)
+        an = jnp.where(
+            dn == 0.0, 0.1,
+            0.01 * (v + 55.0) / jnp.where(dn == 0.0, 1.0, dn),
+        )
+        bn = 0.125 * jnp.exp(-(v + 65.0) / 80.0)
+
+        # Rush-Larsen exponential Euler: A-stable, gates stay in [0,1]
+        sm = am + bm
+        sh = ah + bh
+        sn = an + bn
+        m_inf = am / sm
+        h_inf = ah / sh
+        n_inf = an / sn
+        m_new = m_inf + (m - m_inf) * jnp.exp(-dt_ms * sm)
+        h_new = h_inf + (h - h_inf) * jnp.exp(-dt_ms * sh)
+        n_new = n_inf + (n - n_inf) * jnp.exp(-dt_ms * sn)
+
+        m2 = m_new * m_new
+        n2 = n_new * n_new
+        dv = i_ext + 0.5 * (-54.4 - v)
+        dv += 36.0 * (n2 * n2) * (-77.0 - v)
+        dv += 120.0 * (m2 * m_new) * h_new * (50.0 - v)
+        v_new = v + dv * dt_ms
+        v_new = v_new + (-65.0 - v_new) * (0.004 * ATP) * dt_ms
+
+        spike = (prev_v < 0.0) & (v_new >= 0.0)
+        Ca_new = Ca + jnp.where(spike, 0.02, 0.0)
+        Ca_new = Ca_new - Ca_new * (0.05 + 2.0 * ATP) * dt_sec
+        Ca_new = jnp.maximum(Ca_new, 0.0)
+
+        ATP_new = ATP + (
+            0.008 * (mito / 100.0)
+            - 0.0007 * jnp.abs(i_ext)
+            - 0.006 * Ca_new
+        ) * dt_sec
+        ATP_new = jnp.clip(ATP_new, 0.0, 1.0)
+        atp_killed = ATP_new <= 0.001
+
+        load_term = jnp.maximum(0.0, jnp.abs(i_ext) - 15.0) * 0.0005
+        ca_term = jnp.maximum(0.0, Ca_new - 0.3) * 0.1
+        mito_new = mito + (
+            0.02 * (100.0 - mito) - load_term - ca_term
+        ) * dt_sec
+        mito_new = jnp.clip(mito_new, 0.0, 100.0)
+
+        stress = (
+            jnp.abs(v_new + 65.0) / 250.0
+            + 1.5 * Ca_new
+            + 1.5 * (1.0 - ATP_new)
+            + (100.0 - mito_new) / 100.0
+        )
+
+        integrity_new = integrity + jnp.where(
+            stress < 0.6, 0.1 * dt_sec, -(stress - 0.6) * dt_sec
+        )
+        integrity_new = jnp.clip(integrity_new, 0.0, 100.0)
+
+        damage_new = damage + jnp.where(
+            stress > 1.0, (stress - 1.0) * (0.5 * dt_sec), 0.0
+        )
+        damage_new = jnp.clip(damage_new, 0.0, 100.0)
+
+        health_new = jnp.clip(integrity_new - 0.7 * damage_new, 0.0, 100.0)
+
+        killed = atp_killed | (health_new <= 0.0)
+
+        # already-dead lanes relax toward 0 mV with measurement noise;
+        # killed lanes take the canonical dead state
+        v_dead = v + (0.0 - v) * (dt_sec * 0.2) + noise * 0.5
+
+        def pick(old, kill_val, new):
+            return jnp.where(dead, old, jnp.where(killed, kill_val, new))
+
+        return (
+            jnp.where(dead, v_dead, jnp.where(killed, 0.0, v_new)),
+            jnp.where(dead, prev_v, v),
+            pick(m, m_new, m_new),
+            pick(h, h_new, h_new),
+            pick(n, n_new, n_new),
+            pick(ATP, 0.0, ATP_new),
+            pick(mito, 0.0, mito_new),
+            pick(Ca, 10.0, Ca_new),
+            pick(integrity, 0.0, integrity_new),
+            pick(damage, 100.0, damage_new),
+            pick(health, 0.0, health_new),
+            dead | killed,
+        )
@@ -0,0 +1,335 @@
+"""Optional Numba-compiled simulation kernels.
+
+step_batch runs a whole timer tick worth of substeps (neuron dynamics +
+stimulation) in native code and returns decimated plot samples. The
+dynamics must stay in sync with nt/neuron.py and nt/stim.py, which
+remain the pure-Python fallback when numba is not installed.
+"""
+
+import math
+import random
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def wrap(f):
+            return f
+        return wrap
+
+# packed neuron state layout
+V, PREV_V, M, H, N, ATP, MITO, CA, INTEGRITY, DAMAGE, HEALTH, DEAD = range(12)
+STATE_SIZE = 12
+
+# stimulation modes (indices into Stimulator.MODES)
+MODE_OFF, MODE_CONSTANT, MODE_STEP, MODE_PULSE = 0, 1, 2, 3
+
+
+@njit(cache=True)
+def _current_at(t, mode, amplitude, frequency, pulse_width,
+                protocol_start, step_active, step_start, step_duration):
+    # mirrors Stimulator.current_at; returns (current, step_active)
+    if mode == MODE_OFF:
+        return 0.0, step_active
+
+    if mode == MODE_STEP:
+        if not step_active:
+            return 0.0, step_active
+        rel = t - step_start
+        if 0.0 <= rel < step_duration:
+            return amplitude, step_active
+        return 0.0, False
+
+    rel_t = t - protocol_start
+
+    if mode == MODE_CONSTANT:
+        return amplitude, step_active
+
+    if mode == MODE_PULSE:
+        if frequency <= 0.0 or rel_t < 0.0:
+            return 0.0, step_active
+        period = 1000.0 / frequency
+        width = min(pulse_width, period)
+        phase = rel_t % period
+        if phase < width:
+            return amplitude, step_active
+        return 0.0, step_active
+
+    return 0.0, step_active
+
+
+@njit(cache=True)
+def _kill(state):
+    state[DEAD] = 1.0
+    state[V] = 0.0
+    state[INTEGRITY] = 0.0
+    state[DAMAGE] = 100.0
+    state[HEALTH] = 0.0
+    state[ATP] = 0.0
+    state[MITO] = 0.0
+    state[CA] = 10.0
+
+
+@njit(cache=True)
+def _step_neuron(state, dt_ms, i_ext):
+    # mirrors Neuron.step with kill_mode=False
+    dt_sec = dt_ms / 1000.0
+
+    if state[DEAD] != 0.0:
+        state[V] += (0.0 - state[V]) * dt_sec * 0.2 + random.gauss(0.0, 0.5)
+        return state[V]
+
+    v = state[V]
+
+    am = 0.1 * (v + 40.0) / (1.0 - math.exp(-(v + 40.0) / 10.0)) if v != -40.0 else 1.0
+    bm = 4.0 * math.exp(-(v + 65.0) / 18.0)
+    ah = 0.07 * math.exp(-(v + 65.0) / 20.0)
+    bh = 1.0 / (1.0 + math.exp(-(v + 35.0) / 10.0))
+    an = 0.01 * (v + 55.0) / (1.0 - math.exp(-(v + 55.0) / 10.0)) if v != -55.0 else 0.1
+    bn = 0.125 * math.exp(-(v + 65.0) / 80.0)
+
+    # Rush-Larsen exponential Euler: A-stable, gates stay in [0,1]
+    sm = am + bm
+    sh = ah + bh
+    sn = an + bn
+    m_inf = am / sm
+    h_inf = ah / sh
+    n_inf = an / sn
+    m = m_inf + (state[M] - m_inf) * math.exp(-dt_ms * sm)
+    h = h_inf + (state[H] - h_inf) * math.exp(-dt_ms * sh)
+    n = n_inf + (state[N] - n_inf) * math.exp(-dt_ms * sn)
+    state[M] = m
+    state[H] = h
+    state[N] = n
+
+    gNa = 120.0
+    gK = 36.0
+    gL = 0.5
+
+    ENa = 50.0
+    EK = -77.0
+    EL = -54.4
+
+    # conductance-times-driving-force form: each line is one multiply-add,
+    # which LLVM contracts into an FMA under fastmath
+    m2 = m * m
+    n2 = n * n
+    gNa_eff = gNa * (m2 * m) * h
+    gK_eff = gK * (n2 * n2)
+    dv = i_ext + gL * (EL - v)
+    dv += gK_eff * (EK - v)
+    dv += gNa_eff * (ENa - v)
+    state[V] += dv * dt_ms
+
+    pump_strength = 0.004 * state[ATP]
+    state[V] += (-65.0 - state[V]) * pump_strength * dt_ms
+
+    spike = (state[PREV_V] < 0.0 <= state[V])
+
+    if spike:
+        state[CA] += 0.02
+
+    ca_clear_rate = 0.05 + 2.0 * state[ATP]
+    state[CA] -= state[CA] * ca_clear_rate * dt_sec
+    if state[CA] < 0.0:
+        state[CA] = 0.0
+
+    prod_rate = 0.008 * (state[MITO] / 100.0)
+    pump_cost_rate = 0.0007 * abs(i_ext)
+    ca_cost_rate = 0.006 * state[CA]
+
+    atp = state[ATP] + (prod_rate - pump_cost_rate - ca_cost_rate) * dt_sec
+    state[ATP] = 0.0 if atp < 0.0 else (1.0 if atp > 1.0 else atp)
+
+    if state[ATP] <= 0.001:
+        _kill(state)
+        state[PREV_V] = v
+        return state[V]
+
+    mito_recovery_rate = 0.02 * (100.0 - state[MITO])
+    load_term = max(0.0, abs(i_ext) - 15.0) * 0.0005
+    ca_term = max(0.0, state[CA] - 0.3) * 0.1
+
+    mito = state[MITO] + (mito_recovery_rate - load_term - ca_term) * dt_sec
+    state[MITO] = 0.0 if mito < 0.0 else (100.0 if mito > 100.0 else mito)
+
+    voltage_term = abs(state[V] + 65.0) / 250.0
+    ca_term = 1.5 * state[CA]
+    atp_term = 1.5 * (1.0 - state[ATP])
+    mito_term = (100.0 - state[MITO]) / 100.0
+
+    stress = voltage_term + ca_term + atp_term + mito_term
+
+    if stress < 0.6:
+        integrity = state[INTEGRITY] + 0.1 * dt_sec
+    else:
+        integrity = state[INTEGRITY] - (stress - 0.6) * dt_sec
+    state[INTEGRITY] = 0.0 if integrity < 0.0 else (100.0 if integrity > 100.0 else integrity)
+
+    if stress > 1.0:
+        damage = state[DAMAGE] + (stress - 1.0) * 0.5 * dt_sec
+        state[DAMAGE] = 0.0 if damage < 0.0 else (100.0 if damage > 100.0 else damage)
+
+    health = state[INTEGRITY] - 0.7 * state[DAMAGE]
+    state[HEALTH] = 0.0 if health < 0.0 else (100.0 if health > 100.0 else health)
+
+    if state[HEALTH] <= 0.0:
+        _kill(state)
+
+    state[PREV_V] = v
+    return state[V]
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def step_pop(v, prev_v, m, h, n, ATP, mito, Ca, integrity, damage, health,
+             dead, i_ext, dt_ms):
+    """One dt for a whole population; SoA arrays, one prange lane per neuron.
+
+    Mirrors _step_neuron / NeuronPopulation.step; iterations are fully
+    independent, so the loop splits across cores and fastmath lets LLVM
+    vectorize the straight-line body.
+    """
+    dt_sec = dt_ms / 1000.0
+    for i in prange(v.shape[0]):
+        if dead[i]:
+            v[i] += (0.0 - v[i]) * dt_sec * 0.2 + random.gauss(0.0, 0.5)
+            continue
+
+        vi = v[i]
+
+        am = 0.1 * (vi + 40.0) / (1.0 - math.exp(-(vi + 40.0) / 10.0)) if vi != -40.0 else 1.0
+        bm = 4.0 * math.exp(-(vi + 65.0) / 18.0)
+        ah = 0.07 * math.exp(-(vi + 65.0) / 20.0)
+        bh = 1.0 / (1.0 + math.exp(-(vi + 35.0) / 10.0))
+        an = 0.01 * (vi + 55.0) / (1.0 - math.exp(-(vi + 55.0) / 10.0)) if vi != -55.0 else 0.1
+        bn = 0.125 * math.exp(-(vi + 65.0) / 80.0)
+
+        # Rush-Larsen exponential Euler: A-stable, gates stay in [0,1]
+        sm = am + bm
+        sh = ah + bh
+        sn = an + bn
+        m_inf = am / sm
+        h_inf = ah / sh
+        n_inf = an / sn
+        mi = m_inf + (m[i] - m_inf) * math.exp(-dt_ms * sm)
+        hi = h_inf + (h[i] - h_inf) * math.exp(-dt_ms * sh)
+        ni = n_inf + (n[i] - n_inf) * math.exp(-dt_ms * sn)
+        m[i] = mi
+        h[i] = hi
+        n[i] = ni
+
+        # conductance-times-driving-force form: each line is one
+        # multiply-add, which LLVM contracts into an FMA under fastmath
+        m2 = mi * mi
+        n2 = ni * ni
+        gNa_eff = 120.0 * (m2 * mi) * hi
+        gK_eff = 36.0 * (n2 * n2)
+        dv = i_ext[i] + 0.5 * (-54.4 - vi)
+        dv += gK_eff * (-77.0 - vi)
+        dv += gNa_eff * (50.0 - vi)
+        v[i] += dv * dt_ms
+        v[i] += (-65.0 - v[i]) * (0.004 * ATP[i]) * dt_ms
+
+        if prev_v[i] < 0.0 <= v[i]:
+            Ca[i] += 0.02
+
+        Ca[i] -= Ca[i] * (0.05 + 2.0 * ATP[i]) * dt_sec
+        if Ca[i] < 0.0:
+            Ca[i] = 0.0
+
+        atp = ATP[i] + (
+            0.008 * (mito[i] / 100.0)
+            - 0.0007 * abs(i_ext[i])
+            - 0.006 * Ca[i]
+        ) * dt_sec
+        ATP[i] = 0.0 if atp < 0.0 else (1.0 if atp > 1.0 else atp)
+
+        if ATP[i] <= 0.001:
+            dead[i] = True
+            v[i] = 0.0
+            integrity[i] = 0.0
+            damage[i] = 100.0
+            health[i] = 0.0
+            ATP[i] = 0.0
+            mito[i] = 0.0
+            Ca[i] = 10.0
+            prev_v[i] = vi
+            continue
+
+        load_term = max(0.0, abs(i_ext[i]) - 15.0) * 0.0005
+        ca_term = max(0.0, Ca[i] - 0.3) * 0.1
+        mt = mito[i] + (0.02 * (100.0 - mito[i]) - load_term - ca_term) * dt_sec
+        mito[i] = 0.0 if mt < 0.0 else (100.0 if mt > 100.0 else mt)
+
+        stress = (
+            abs(v[i] + 65.0) / 250.0
+            + 1.5 * Ca[i]
+            + 1.5 * (1.0 - ATP[i])
+            + (100.0 - mito[i]) / 100.0
+        )
+
+        if stress < 0.6:
+            integ = integrity[i] + 0.1 * dt_sec
+        else:
+            integ = integrity[i] - (stress - 0.6) * dt_sec
+        integrity[i] = 0.0 if integ < 0.0 else (100.0 if integ > 100.0 else integ)
+
+        if stress > 1.0:
+            dmg = damage[i] + (stress - 1.0) * 0.5 * dt_sec
+            damage[i] = 0.0 if dmg < 0.0 else (100.0 if dmg > 100.0 else dmg)
+
+        hlth = integrity[i] - 0.7 * damage[i]
+        health[i] = 0.0 if hlth < 0.0 else (100.0 if hlth > 100.0 else hlth)
+
+        if health[i] <= 0.0:
+            dead[i] = True
+            v[i] = 0.0
+            integrity[i] = 0.0
+            damage[i] = 100.0
+            health[i] = 0.0
+            ATP[i] = 0.0
+            mito[i] = 0.0
+            Ca[i] = 10.0
+
+        prev_v[i] = vi
+
+
+@njit(cache=True)
+def step_batch(state, dt_ms, n_steps, plot_every, steps_since_plot, t_ms,
+               mode, amplitude, frequency, pulse_width,
+               protocol_start, step_active, step_start, step_duration,
+               out_t, out_v, out_meta):
+    """Run n_steps substeps, writing every plot_every-th sample to the
+    out arrays.
+
+    Returns (t_ms, steps_since_plot, step_active, n_out).
+    """
+    n_out = 0
+    for _ in range(n_steps):
+        i_ext, step_active = _current_at(
+            t_ms, mode, amplitude, frequency, pulse_width,
+            protocol_start, step_active, step_start, step_duration,
+        )
+        v_true = _step_neuron(state, dt_ms, i_ext)
+
+        t_ms += dt_ms
+        steps_since_plot += 1
+
+        if steps_since_plot >= plot_every:
+            steps_since_plot = 0
+            out_t[n_out] = t_ms / 1000.0
+            out_v[n_out] = v_true
+            out_meta[0, n_out] = state[ATP]
+            out_meta[1, n_out] = state[CA]
+            out_meta[2, n_out] = state[MITO]
+            out_meta[3, n_out] = state[INTEGRITY]
+            out_meta[4, n_out] = state[DAMAGE]
+            n_out += 1
+
+    return t_ms, steps_since_plot, step_active, n_out
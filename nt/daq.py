@@ -1,25 +1,282 @@
 import numpy as np
 
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+try:
+    # AOT-compiled loop (no JIT warmup); see _daq_native.pyx
+    from . import _daq_native
+    _HAVE_NATIVE = True
+except ImportError:
+    _HAVE_NATIVE = False
+
+
+if _HAVE_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _quantize_kernel(noisy, min_v, max_v, inv_step, step_size):
+        out = np.empty_like(noisy)
+        for i in range(noisy.shape[0]):
+            x = noisy[i]
+            if x < min_v:
+                x = min_v
+            elif x > max_v:
+                x = max_v
+            out[i] = round((x - min_v) * inv_step) * step_size + min_v
+        return out
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _acquire_batch(true_v, noise, min_v, max_v, inv_step, step_size, out):
+        # flat loop over all channels x samples; iterations are independent
+        for i in prange(true_v.shape[0]):
+            x = true_v[i] + noise[i]
+            if x < min_v:
+                x = min_v
+            elif x > max_v:
+                x = max_v
+            out[i] = round((x - min_v) * inv_step) * step_size + min_v
+
+
+def _make_quantizer(min_v, max_v, inv_step, step_size):
+    # specialize the scalar quantizer for fixed range/resolution: the
+    # constants are bound as defaults so the hot path only does LOAD_FAST
+    def quantize(val, _min_v=min_v, _max_v=max_v, _inv_step=inv_step, _step_size=step_size):
+        val = _min_v if val < _min_v else (_max_v if val > _max_v else val)
+        return round((val - _min_v) * _inv_step) * _step_size + _min_v
+    return quantize
+
+
 class DAQ:
 
     def __init__(self):
-        self.adc_bits = 12                 # precision
-        self.noise_level = 0.5             # mV noise
-        self.voltage_range = (-100.0, 100.0)  # mV range
+        self._adc_bits = 12                # precision
+        self._noise_level = 0.5            # mV noise
+        self._voltage_range = (-100.0, 100.0)  # mV range
+
+        self._rng = np.random.default_rng()
+
+        # pre-generated gaussian noise, refilled in blocks
+        self._noise_buf = None
+        self._noise_idx = 0
+        self._noise_bufsize = 4096
+
+        # reusable batch scratch (see _scratch); allocated on first use
+        self._batch_sum = None
+        self._batch_noise = None
+        self._native_in = None
+        self._native_out = None
 
-    def quantize(self, val):
-        min_v, max_v = self.voltage_range
-        steps = 2 ** self.adc_bits
-        step_size = (max_v - min_v) / steps
+        # SoA sample store (see alloc_buffers)
+        self._ts = None
+        self._codes = None
+        self._capacity = 0
+        self._write = 0
+        self._filled = 0
 
-        # clamp
-        val = max(min_v, min(val, max_v))
+        self._recompute()
 
-        # quantize
-        q_val = round((val - min_v) / step_size) * step_size + min_v
-        return q_val
+    def _recompute(self):
+        # derived quantization constants, hoisted out of the per-sample path;
+        # kept in float32 so the whole acquisition pipeline stays
+        # single-precision (12-bit codes are far below fp32 resolution)
+        min_v, max_v = self._voltage_range
+        self._steps = 1 << self._adc_bits
+        self._min_v = np.float32(min_v)
+        self._max_v = np.float32(max_v)
+        self._step_size = np.float32((max_v - min_v) / self._steps)
+        self._inv_step = np.float32(self._steps / (max_v - min_v))
+
+        # per-instance specialized scalar quantizer (plain-float constants)
+        self.quantize = _make_quantizer(
+            min_v, max_v, float(self._inv_step), float(self._step_size)
+        )
+
+    @property
+    def adc_bits(self):
+        return self._adc_bits
+
+    @adc_bits.setter
+    def adc_bits(self, value):
+        self._adc_bits = value
+        self._recompute()
+
+    @property
+    def voltage_range(self):
+        return self._voltage_range
+
+    @voltage_range.setter
+    def voltage_range(self, value):
+        self._voltage_range = value
+        self._recompute()
+
+    @property
+    def noise_level(self):
+        return self._noise_level
+
+    @noise_level.setter
+    def noise_level(self, value):
+        self._noise_level = value
+        self._noise_buf = None
+        self._noise_idx = 0
+
+    def _next_noise(self):
+        if self._noise_buf is None or self._noise_idx >= self._noise_bufsize:
+            self._noise_buf = (
+                self._rng.standard_normal(self._noise_bufsize, dtype=np.float32)
+                * np.float32(self._noise_level)
+            )
+            self._noise_idx = 0
+        val = self._noise_buf[self._noise_idx]
+        self._noise_idx += 1
+        return val
+
+    def _quantize_np(self, val):
+        # numpy-scalar variant: no boxing through the round/max/min builtins
+        min_v = self._min_v
+        clipped = np.clip(val, min_v, self._max_v)
+        return np.rint((clipped - min_v) * self._inv_step) * self._step_size + min_v
 
     def acquire_sample(self, true_voltage):
-        noisy = true_voltage + np.random.normal(0, self.noise_level)
-        digitized = self.quantize(noisy)
+        noisy = true_voltage + self._next_noise()
+        digitized = self._quantize_np(noisy)
         return digitized
+
+    def _scratch(self, n):
+        if self._batch_sum is None or self._batch_sum.shape[0] < n:
+            self._batch_sum = np.empty(n, np.float32)
+            self._batch_noise = np.empty(n, np.float32)
+        return self._batch_sum[:n], self._batch_noise[:n]
+
+    def acquire_samples(self, true_voltages, out=None):
+        min_v = self._min_v
+        flat = np.ascontiguousarray(true_voltages, np.float32).reshape(-1)
+        n = flat.shape[0]
+
+        noisy, noise = self._scratch(n)
+        self._rng.standard_normal(out=noise, dtype=np.float32)
+        noise *= np.float32(self._noise_level)
+        np.add(flat, noise, out=noisy)
+
+        if out is None:
+            # np.shape also handles list/tuple input, which flat already
+            # normalized away
+            out = np.empty(np.shape(true_voltages), np.float32)
+        elif not out.flags["C_CONTIGUOUS"]:
+            # reshape(-1) on a non-contiguous array returns a copy and the
+            # writes below would be silently discarded
+            raise ValueError("out must be C-contiguous")
+        out_flat = out.reshape(-1)
+
+        if _HAVE_NATIVE:
+            if self._native_in is None or self._native_in.shape[0] < n:
+                self._native_in = np.empty(n, np.float64)
+                self._native_out = np.empty(n, np.float64)
+            nat_in = self._native_in[:n]
+            np.copyto(nat_in, noisy)
+            _daq_native.quantize_array(
+                nat_in, float(min_v), float(self._max_v),
+                float(self._inv_step), float(self._step_size),
+                self._native_out[:n],
+            )
+            np.copyto(out_flat, self._native_out[:n])
+            return out
+
+        # quantize the whole block in place, no per-frame temporaries
+        np.clip(noisy, min_v, self._max_v, out=noisy)
+        np.subtract(noisy, min_v, out=noisy)
+        np.multiply(noisy, self._inv_step, out=noisy)
+        np.rint(noisy, out=noisy)
+        np.multiply(noisy, self._step_size, out=noisy)
+        np.add(noisy, min_v, out=out_flat)
+        return out
+
+    def quantize_codes(self, voltages):
+        # integer ADC codes in [0, steps-1] instead of the float round-trip
+        codes = np.rint((voltages - self._min_v) * self._inv_step).astype(np.int32)
+        return np.clip(codes, 0, self._steps - 1).astype(np.uint16)
+
+    def codes_to_voltages(self, codes):
+        return codes * self._step_size + self._min_v
+
+    def acquire_samples_numba(self, true_voltages):
+        if not _HAVE_NUMBA:
+            return self.acquire_samples(true_voltages)
+
+        tv = np.asarray(true_voltages, np.float32)
+        noise = (
+            self._rng.standard_normal(tv.shape, dtype=np.float32)
+            * np.float32(self.noise_level)
+        )
+        return _quantize_kernel(
+            tv + noise,
+            self._min_v, self._max_v, self._inv_step, self._step_size,
+        )
+
+    # sample store: timestamps and ADC codes as separate ring buffers so
+    # consumers that only need one column read it contiguously
+
+    def alloc_buffers(self, capacity):
+        self._ts = np.empty(capacity, np.float64)
+        self._codes = np.empty(capacity, np.uint16)
+        self._capacity = capacity
+        self._write = 0
+        self._filled = 0
+
+    def push_samples(self, ts_block, code_block):
+        n = len(ts_block)
+        cap = self._capacity
+        w = self._write
+
+        first = min(n, cap - w)
+        np.copyto(self._ts[w:w + first], ts_block[:first])
+        np.copyto(self._codes[w:w + first], code_block[:first])
+        rest = n - first
+        if rest:
+            np.copyto(self._ts[:rest], ts_block[first:])
+            np.copyto(self._codes[:rest], code_block[first:])
+
+        self._write = (w + n) % cap
+        self._filled = min(cap, self._filled + n)
+
+    def get_window(self, start, stop):
+        # logical index 0 is the oldest retained sample; returns views
+        # (no copy) unless the window wraps the ring boundary
+        start = max(0, start)
+        stop = min(self._filled, stop)
+        if stop <= start:
+            return self._ts[:0], self._codes[:0]
+
+        base = (self._write - self._filled) % self._capacity
+        lo = (base + start) % self._capacity
+        hi = (base + stop) % self._capacity
+
+        if lo < hi or hi == 0:
+            hi = hi if hi else self._capacity
+            return self._ts[lo:hi], self._codes[lo:hi]
+
+        ts = np.concatenate((self._ts[lo:], self._ts[:hi]))
+        codes = np.concatenate((self._codes[lo:], self._codes[:hi]))
+        return ts, codes
+
+    def acquire_samples_parallel(self, true_voltages, out=None):
+        # threaded variant for multi-channel batches; falls back to the
+        # serial paths when numba is unavailable
+        if not _HAVE_NUMBA:
+            return self.acquire_samples(true_voltages)
+
+        flat = np.ascontiguousarray(true_voltages, np.float32).reshape(-1)
+        noise = (
+            self._rng.standard_normal(flat.shape, dtype=np.float32)
+            * np.float32(self.noise_level)
+        )
+        if out is None:
+            out = np.empty(np.shape(true_voltages), np.float32)
+        elif not out.flags["C_CONTIGUOUS"]:
+            raise ValueError("out must be C-contiguous")
+        _acquire_batch(
+            flat, noise, self._min_v, self._max_v,
+            self._inv_step, self._step_size, out.reshape(-1),
+        )
+        return out
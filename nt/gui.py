@@ -3,14 +3,21 @@ from PySide6.QtWidgets import (
     QSlider, QPushButton, QGroupBox, QPlainTextEdit, QTabWidget,
     QStackedWidget, QMenuBar, QMenu, QMessageBox
 )
-from PySide6.QtCore import QTimer, Qt
+from PySide6.QtCore import QTimer, Qt, Signal, Slot, QObject, QThread, QMetaObject
+from functools import partial
+import numpy as np
 import pyqtgraph as pg
 from collections import deque
 
-from .neuron import Neuron
+from .neuron import (
+    Neuron,
+    FLAG_ATP_LOW, FLAG_CA_HIGH, FLAG_MITO_STRESS,
+    FLAG_INTEGRITY_LOW, FLAG_DAMAGE_HIGH, FLAG_CASCADE, FLAG_ALL,
+)
 from .stim import Stimulator
 from .daq import DAQ
 from .tutorial import TutorialOverlay
+from . import _kernels
 
 
 MODE_DESCRIPTIONS = {
@@ -33,18 +40,280 @@ VIEW_WINDOWS = {
     "Spikes (0.1 s)": 0.1,
 }
 
+# pre-built %-templates for the status labels: f-strings re-parse their
+# format spec on every call, str.__mod__ does not
+_FMT_VM = "Vm: %6.2f mV"
+_FMT_HEALTH = "Health: %5.1f%%"
+_FMT_ATP = "ATP: %4.2f"
+_FMT_CA = "Ca²⁺: %4.2f"
+_FMT_MITO = "Mitochondria: %5.1f%%"
+_FMT_INTEGRITY = "Integrity: %5.1f%%"
+_FMT_DAMAGE = "Damage: %5.1f%%"
+_FMT_STATE = "State: %s"
+
+
+class SignalRing:
+    """Fixed-capacity (t, v) sample ring; grows geometrically when unlimited.
+
+    Values are stored as float32 — these buffers only feed pyqtgraph, which
+    renders single-precision anyway; timestamps stay float64 for long runs.
+    """
+
+    def __init__(self, capacity, unlimited=False):
+        self.unlimited = unlimited
+        self.capacity = capacity
+        self.t = np.empty(capacity, dtype=np.float64)
+        self.v = np.empty(capacity, dtype=np.float32)
+        self.head = 0
+        self.count = 0
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+    def append(self, t, v):
+        if self.count == self.capacity and self.unlimited:
+            self._grow(self.capacity * 2)
+        self.t[self.head] = t
+        self.v[self.head] = v
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def _grow(self, capacity):
+        t, v = self.views()
+        new_t = np.empty(capacity, dtype=np.float64)
+        new_v = np.empty(capacity, dtype=np.float32)
+        new_t[:t.shape[0]] = t
+        new_v[:v.shape[0]] = v
+        self.t = new_t
+        self.v = new_v
+        self.head = self.count
+        self.capacity = capacity
+
+    def resize(self, capacity):
+        # keep the most recent samples, dropping the oldest if shrinking
+        if capacity == self.capacity:
+            return
+        t, v = self.views()
+        keep = min(capacity, t.shape[0])
+        new_t = np.empty(capacity, dtype=np.float64)
+        new_v = np.empty(capacity, dtype=np.float32)
+        new_t[:keep] = t[-keep:] if keep else t[:0]
+        new_v[:keep] = v[-keep:] if keep else v[:0]
+        self.t = new_t
+        self.v = new_v
+        self.capacity = capacity
+        self.count = keep
+        self.head = keep % capacity
+
+    def views(self):
+        # oldest-to-newest; zero-copy slices unless the ring has wrapped
+        if self.count < self.capacity:
+            return self.t[:self.count], self.v[:self.count]
+        head = self.head
+        if head == 0:
+            return self.t, self.v
+        return (
+            np.concatenate((self.t[head:], self.t[:head])),
+            np.concatenate((self.v[head:], self.v[:head])),
+        )
+
 
 class ClickableLabel(QLabel):
-    def __init__(self, text="", parent=None):
-        super().__init__(text, parent)
-        self.clicked_callback = None
+    clicked = Signal()
 
     def mousePressEvent(self, event):
-        if self.clicked_callback is not None:
-            self.clicked_callback()
+        self.clicked.emit()
         super().mousePressEvent(event)
 
 
+class SimWorker(QObject):
+    """Runs the simulation on its own thread so GUI events can't starve ticks.
+
+    Owns the tick timer and steps the neuron/stimulator/DAQ; the GUI reads
+    scalar neuron state directly (safe under the GIL, parameters are plain
+    float/str writes) and receives plot samples via samplesReady.
+    """
+
+    samplesReady = Signal(object, object, object)  # t [s], v [mV], meta (5, n)
+
+    def __init__(self, neuron, stim, daq, dt=0.025, timer_interval=20, plot_dt_ms=1.0):
+        super().__init__()
+        self.neuron = neuron
+        self.stim = stim
+        self.daq = daq
+
+        self.dt = dt
+        self.timer_interval = timer_interval
+        self.time_scale_factor = 1.0
+        self.plot_dt_ms = plot_dt_ms
+        self.time_ms = 0.0
+        # integer decimation counter: no float drift in sample spacing
+        self._steps_per_plot = max(1, int(round(plot_dt_ms / dt)))
+        self._steps_since_plot = 0
+
+        # scratch for the batched numba sim path
+        self._state_buf = np.empty(_kernels.STATE_SIZE, dtype=np.float64)
+        self._out_cap = 0
+        self._out_t = None
+        self._out_v = None
+        self._out_meta = None
+
+        self._timer = None  # created lazily so it lives in the worker thread
+
+    @Slot()
+    def start(self):
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.timeout.connect(self._tick)
+        self._timer.start(self.timer_interval)
+
+    @Slot()
+    def stop(self):
+        if self._timer is not None:
+            self._timer.stop()
+
+    @Slot()
+    def reset_clock(self):
+        # invoked queued so it runs on the worker thread after any "stop"
+        # already in its queue — a synchronous call from the GUI thread
+        # could race a tick still executing and lose the reset
+        self.time_ms = 0.0
+        self._steps_since_plot = 0
+
+    def _tick(self):
+        steps_to_run = int((self.timer_interval / self.dt) * self.time_scale_factor)
+        if steps_to_run == 0 and self.time_scale_factor > 0:
+            steps_to_run = 1
+
+        if _kernels.HAVE_NUMBA:
+            self._tick_batch(steps_to_run)
+            return
+
+        # one vectorized call instead of steps_to_run current_at lookups
+        i_stim_arr = self.stim.current_array(self.time_ms, self.dt, steps_to_run)
+
+        # hoist everything the loop touches into locals: at high time scales
+        # this body runs tens of thousands of times per tick, and repeated
+        # attribute/descriptor lookups dominate
+        n = self.neuron
+        dt = self.dt
+        step = n.step
+        acquire = self.daq.acquire_sample
+        steps_per_plot = self._steps_per_plot
+        steps_since_plot = self._steps_since_plot
+        t_ms = self.time_ms
+
+        ts = []
+        vs = []
+        meta_cols = []
+        ts_app = ts.append
+        vs_app = vs.append
+        meta_app = meta_cols.append
+
+        for k in range(steps_to_run):
+            v_true = step(dt, float(i_stim_arr[k]), kill_mode=False)
+
+            t_ms += dt
+            steps_since_plot += 1
+
+            if steps_since_plot >= steps_per_plot:
+                steps_since_plot = 0
+                vs_app(float(acquire(v_true)))
+                ts_app(t_ms / 1000.0)
+                meta_app((n.ATP, n.Ca, n.mito, n.integrity, n.damage))
+
+        self.time_ms = t_ms
+        self._steps_since_plot = steps_since_plot
+
+        if ts:
+            self.samplesReady.emit(
+                np.array(ts),
+                np.array(vs, dtype=np.float32),
+                np.array(meta_cols).T,
+            )
+
+    # batched sim path (numba)
+
+    def _pack_state(self):
+        n = self.neuron
+        s = self._state_buf
+        s[_kernels.V] = n.v
+        s[_kernels.PREV_V] = n.prev_v
+        s[_kernels.M] = n.m
+        s[_kernels.H] = n.h
+        s[_kernels.N] = n.n
+        s[_kernels.ATP] = n.ATP
+        s[_kernels.MITO] = n.mito
+        s[_kernels.CA] = n.Ca
+        s[_kernels.INTEGRITY] = n.integrity
+        s[_kernels.DAMAGE] = n.damage
+        s[_kernels.HEALTH] = n.health
+        s[_kernels.DEAD] = 1.0 if n.dead else 0.0
+        return s
+
+    def _unpack_state(self):
+        n = self.neuron
+        s = self._state_buf
+        n.v = s[_kernels.V]
+        n.prev_v = s[_kernels.PREV_V]
+        n.m = s[_kernels.M]
+        n.h = s[_kernels.H]
+        n.n = s[_kernels.N]
+        n.ATP = s[_kernels.ATP]
+        n.mito = s[_kernels.MITO]
+        n.Ca = s[_kernels.CA]
+        n.integrity = s[_kernels.INTEGRITY]
+        n.damage = s[_kernels.DAMAGE]
+        n.health = s[_kernels.HEALTH]
+        n.dead = s[_kernels.DEAD] != 0.0
+
+    def _ensure_out_buffers(self, steps_to_run):
+        need = int(steps_to_run * self.dt / self.plot_dt_ms) + 2
+        if need > self._out_cap:
+            self._out_cap = need
+            self._out_t = np.empty(need, dtype=np.float64)
+            self._out_v = np.empty(need, dtype=np.float64)
+            self._out_meta = np.empty((5, need), dtype=np.float64)
+
+    def _tick_batch(self, steps_to_run):
+        self._ensure_out_buffers(steps_to_run)
+        stim = self.stim
+
+        step_active_in = stim.step_active
+        t_ms, steps_since_plot, step_active, n_out = _kernels.step_batch(
+            self._pack_state(), self.dt, steps_to_run,
+            self._steps_per_plot, self._steps_since_plot, self.time_ms,
+            stim.MODES.index(stim.mode), stim.amplitude,
+            stim.frequency, stim.pulse_width,
+            stim.protocol_start_time, step_active_in,
+            stim.step_start_time, stim.step_duration,
+            self._out_t, self._out_v, self._out_meta,
+        )
+
+        self.time_ms = t_ms
+        self._steps_since_plot = steps_since_plot
+        # write the kernel's view of the STEP flag back only if the GUI
+        # thread didn't trigger_step() while the batch ran; a fresh
+        # trigger must survive to the next batch, not be clobbered
+        if stim.step_active == step_active_in:
+            stim.step_active = bool(step_active)
+        self._unpack_state()
+
+        if n_out == 0:
+            return
+
+        v_meas = self.daq.acquire_samples(self._out_v[:n_out])
+        # copies: the out buffers are reused next tick and the signal is
+        # delivered queued to the GUI thread
+        self.samplesReady.emit(
+            self._out_t[:n_out].copy(),
+            np.asarray(v_meas, dtype=np.float32).copy(),
+            self._out_meta[:, :n_out].copy(),
+        )
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -54,36 +323,55 @@ class MainWindow(QMainWindow):
         self.stim = Stimulator()
         self.daq = DAQ()
 
-        # timing
-        self.time_ms = 0.0
-        self.dt = 0.025
-        self.timer_interval = 20
-        self.time_scale_factor = 1.0
         self.running = False
-
         self.plot_dt_ms = 1.0
-        self.time_since_last_plot = 0.0
+
+        # simulation runs on its own thread
+        self._worker = SimWorker(
+            self.neuron, self.stim, self.daq, plot_dt_ms=self.plot_dt_ms
+        )
+        self._sim_thread = QThread(self)
+        self._worker.moveToThread(self._sim_thread)
+        self._worker.samplesReady.connect(self._on_samples)
+        self._sim_thread.start()
 
         self.window_sec = 2.0
         self.plot_buffer_size = int(self.window_sec * 1000 / self.plot_dt_ms)
-        self.t_data = deque(maxlen=self.plot_buffer_size)
-        self.v_data = deque(maxlen=self.plot_buffer_size)
 
-        # voltage history
+        # LIVE trace backing store: fixed x-axis plus a rolling y-buffer with
+        # a NaN break at the write head, so each frame hands pyqtgraph the
+        # same two ndarrays instead of rebuilding them (move pointers, not
+        # data). The write index is phase-locked to the sample time —
+        # slot = (t / plot_dt) mod N — and the curve offset snaps in
+        # whole-window increments, so x + offset is the true time of the
+        # current sweep and the trace repaints scope-style
+        self._live_xbuf = np.linspace(
+            0.0, self.window_sec, self.plot_buffer_size, endpoint=False
+        )
+        self._live_ybuf = np.full(self.plot_buffer_size, np.nan, dtype=np.float32)
+        self._live_head = 0
+        self._live_t_last = 0.0
+
+        # voltage history (unlimited by default; ring grows as needed)
         self.vm_history_seconds = None
         self.vm_history_maxlen = None
-        self.t_full = deque()
-        self.v_full = deque()
+        self.hist_ring = SignalRing(int(60.0 * 1000.0 / self.plot_dt_ms), unlimited=True)
 
         self.voltage_view_mode = "LIVE"
-
-        # metabolism history
-        self.meta_t = []
-        self.meta_atp = []
-        self.meta_ca = []
-        self.meta_mito = []
-        self.meta_integrity = []
-        self.meta_damage = []
+        self._live_right = 0.0  # right edge of the LIVE x-range
+
+        # metabolism history: preallocated ring buffers (SoA), shared head
+        self._meta_capacity = int(600.0 * 1000.0 / self.plot_dt_ms)
+        self._meta_head = 0
+        self._meta_count = 0
+        self.meta_t = np.empty(self._meta_capacity, dtype=np.float64)
+        # signal buffers are plot-only; float32 halves their footprint and
+        # the simulation state itself stays float64
+        self.meta_atp = np.empty(self._meta_capacity, dtype=np.float32)
+        self.meta_ca = np.empty(self._meta_capacity, dtype=np.float32)
+        self.meta_mito = np.empty(self._meta_capacity, dtype=np.float32)
+        self.meta_integrity = np.empty(self._meta_capacity, dtype=np.float32)
+        self.meta_damage = np.empty(self._meta_capacity, dtype=np.float32)
 
         self.was_firing = False
 
@@ -91,6 +379,24 @@ class MainWindow(QMainWindow):
         self.step_recovery_logged = False
 
         self.meta_detail_var = None
+        # set when samples arrived while the Metabolism tab was hidden
+        self._meta_dirty = False
+
+        # last displayed status values, rounded to label precision
+        self._last_status = {}
+        self._last_state_css = ""
+
+        # pending log lines, flushed in one append per redraw
+        self._log_queue = deque()
+
+        # display refresh is decoupled from simulation ticks: the worker
+        # only fills buffers, this timer repaints at ~30 FPS when dirty.
+        # Created before _build_ui, which logs during construction and
+        # log() consults the timer
+        self._dirty = False
+        self._draw_interval = 33
+        self._draw_timer = QTimer()
+        self._draw_timer.timeout.connect(self._redraw)
 
         self._setup_pg_theme()
         self._build_ui()
@@ -126,9 +432,6 @@ class MainWindow(QMainWindow):
             ),
         ]
 
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_loop)
-
         self._apply_vm_history_limit()
 
     def _setup_pg_theme(self):
@@ -143,11 +446,12 @@ class MainWindow(QMainWindow):
         else:
             maxlen = max(1, int(self.vm_history_seconds * 1000.0 / self.plot_dt_ms))
 
-        old_t = list(self.t_full)
-        old_v = list(self.v_full)
-
-        self.t_full = deque(old_t[-maxlen:] if maxlen else old_t, maxlen=maxlen)
-        self.v_full = deque(old_v[-maxlen:] if maxlen else old_v, maxlen=maxlen)
+        if maxlen is None:
+            self.hist_ring.unlimited = True
+        else:
+            self.hist_ring.unlimited = False
+            if maxlen != self.hist_ring.capacity:
+                self.hist_ring.resize(maxlen)
         self.vm_history_maxlen = maxlen
 
     def set_voltage_view_mode(self, mode: str):
@@ -156,8 +460,12 @@ class MainWindow(QMainWindow):
         if mode == "HISTORY":
             self.voltage_plot.setMouseEnabled(x=True, y=True)
             self.log("Voltage view set to HISTORY.")
-            if self.t_full:
-                self.curve_vm.setData(x=list(self.t_full), y=list(self.v_full))
+            # history data carries absolute timestamps; shed the LIVE
+            # sweep offset or the whole trace renders shifted
+            self.curve_vm.setPos(0, 0)
+            if self.hist_ring.count:
+                t, v = self.hist_ring.views()
+                self.curve_vm.setData(x=t, y=v)
         else:
             self.voltage_plot.setMouseEnabled(x=not self.running, y=True)
             self.log("Voltage view set to LIVE.")
@@ -174,14 +482,15 @@ class MainWindow(QMainWindow):
 
         view_menu = menubar.addMenu("View")
 
+        # data-driven dispatch: each action carries its payload via setData
+        # and shares one slot per menu, instead of a captured lambda per item
+
         vv_menu = QMenu("Voltage View", self)
         view_menu.addMenu(vv_menu)
-        vv_menu.addAction("Live (follow)").triggered.connect(
-            lambda checked=False: self.set_voltage_view_mode("LIVE")
-        )
-        vv_menu.addAction("History (pan/zoom)").triggered.connect(
-            lambda checked=False: self.set_voltage_view_mode("HISTORY")
-        )
+        for label, mode in [("Live (follow)", "LIVE"), ("History (pan/zoom)", "HISTORY")]:
+            act = vv_menu.addAction(label)
+            act.setData(mode)
+            act.triggered.connect(self._on_voltage_view_action)
 
         hist_menu = QMenu("Voltage History Length", self)
         view_menu.addMenu(hist_menu)
@@ -191,23 +500,23 @@ class MainWindow(QMainWindow):
             ("Last 2 min", 120.0),
             ("Last 10 min", 600.0),
         ]:
-            hist_menu.addAction(label).triggered.connect(
-                lambda checked=False, s=sec, l=label: self.set_voltage_history_length(s, l)
-            )
+            act = hist_menu.addAction(label)
+            act.setData((sec, label))
+            act.triggered.connect(self._on_history_length_action)
 
         time_menu = QMenu("Time Scale", self)
         view_menu.addMenu(time_menu)
         for label, factor in TIME_SCALES.items():
-            time_menu.addAction(label).triggered.connect(
-                lambda checked=False, f=factor, l=label: self.set_time_scale(f, l)
-            )
+            act = time_menu.addAction(label)
+            act.setData((factor, label))
+            act.triggered.connect(self._on_time_scale_action)
 
         window_menu = QMenu("Voltage Window", self)
         view_menu.addMenu(window_menu)
         for label, w in VIEW_WINDOWS.items():
-            window_menu.addAction(label).triggered.connect(
-                lambda checked=False, width=w, l=label: self.set_voltage_window(width, l)
-            )
+            act = window_menu.addAction(label)
+            act.setData((w, label))
+            act.triggered.connect(self._on_voltage_window_action)
 
         sim_menu = menubar.addMenu("Simulation")
         sim_menu.addAction("Generate report").triggered.connect(self.generate_report)
@@ -216,6 +525,23 @@ class MainWindow(QMainWindow):
         help_menu.addAction("About").triggered.connect(self.show_about)
         help_menu.addAction("Tutorial").triggered.connect(self.start_tutorial)
 
+    # menu slots
+
+    def _on_voltage_view_action(self):
+        self.set_voltage_view_mode(self.sender().data())
+
+    def _on_history_length_action(self):
+        sec, label = self.sender().data()
+        self.set_voltage_history_length(sec, label)
+
+    def _on_time_scale_action(self):
+        factor, label = self.sender().data()
+        self.set_time_scale(factor, label)
+
+    def _on_voltage_window_action(self):
+        width, label = self.sender().data()
+        self.set_voltage_window(width, label)
+
     # tutorial
 
     def start_tutorial(self):
@@ -357,11 +683,13 @@ class MainWindow(QMainWindow):
         self.voltage_plot.setYRange(-80, 50)
         self.voltage_plot.showGrid(x=True, y=True, alpha=0.2)
         self.voltage_plot.setMouseEnabled(x=True, y=True)
+        self.voltage_plot.getViewBox().disableAutoRange()
         self.curve_vm = self.voltage_plot.plot(pen={"color": "#8bff9e", "width": 2})
         self.curve_vm.setClipToView(True)
 
         self.curve_vm.setDownsampling(auto=True, method="peak")
-        self.curve_vm.setSkipFiniteCheck(True)
+        # no setSkipFiniteCheck here: the LIVE backing store carries a
+        # deliberate NaN break at the write head
 
         vlayout.addWidget(self.voltage_plot)
         self.tab_voltage.setLayout(vlayout)
@@ -376,35 +704,35 @@ class MainWindow(QMainWindow):
 
         self.lbl_atp_plot = ClickableLabel("ATP")
         self.lbl_atp_plot.setStyleSheet("color: #d7e1d9; font-weight: 600;")
-        self.lbl_atp_plot.clicked_callback = lambda: self.show_meta_detail("ATP")
+        self.lbl_atp_plot.clicked.connect(partial(self.show_meta_detail, "ATP"))
         self.plot_atp = pg.PlotWidget()
         self.plot_atp.setLabel("left", "ATP", units="")
         self.curve_atp = self.plot_atp.plot(pen={"color": "#88ff88", "width": 1})
 
         self.lbl_ca_plot = ClickableLabel("Ca²⁺")
         self.lbl_ca_plot.setStyleSheet("color: #d7e1d9; font-weight: 600;")
-        self.lbl_ca_plot.clicked_callback = lambda: self.show_meta_detail("Ca")
+        self.lbl_ca_plot.clicked.connect(partial(self.show_meta_detail, "Ca"))
         self.plot_ca = pg.PlotWidget()
         self.plot_ca.setLabel("left", "Ca²⁺", units="")
         self.curve_ca = self.plot_ca.plot(pen={"color": "#ff8888", "width": 1})
 
         self.lbl_mito_plot = ClickableLabel("Mitochondria")
         self.lbl_mito_plot.setStyleSheet("color: #d7e1d9; font-weight: 600;")
-        self.lbl_mito_plot.clicked_callback = lambda: self.show_meta_detail("Mito")
+        self.lbl_mito_plot.clicked.connect(partial(self.show_meta_detail, "Mito"))
         self.plot_mito = pg.PlotWidget()
         self.plot_mito.setLabel("left", "Mito (%)", units="")
         self.curve_mito = self.plot_mito.plot(pen={"color": "#88ccff", "width": 1})
 
         self.lbl_integrity_plot = ClickableLabel("Integrity")
         self.lbl_integrity_plot.setStyleSheet("color: #d7e1d9; font-weight: 600;")
-        self.lbl_integrity_plot.clicked_callback = lambda: self.show_meta_detail("Integrity")
+        self.lbl_integrity_plot.clicked.connect(partial(self.show_meta_detail, "Integrity"))
         self.plot_integrity = pg.PlotWidget()
         self.plot_integrity.setLabel("left", "Integrity", units="")
         self.curve_integrity = self.plot_integrity.plot(pen={"color": "#ffff88", "width": 1})
 
         self.lbl_damage_plot = ClickableLabel("Damage")
         self.lbl_damage_plot.setStyleSheet("color: #d7e1d9; font-weight: 600;")
-        self.lbl_damage_plot.clicked_callback = lambda: self.show_meta_detail("Damage")
+        self.lbl_damage_plot.clicked.connect(partial(self.show_meta_detail, "Damage"))
         self.plot_damage = pg.PlotWidget()
         self.plot_damage.setLabel("left", "Damage", units="")
         self.curve_damage = self.plot_damage.plot(pen={"color": "#ffbb55", "width": 1})
@@ -419,6 +747,16 @@ class MainWindow(QMainWindow):
             ov_layout.addWidget(lbl)
             ov_layout.addWidget(plt)
 
+        # metabolism histories span the whole run; draw at pixel budget,
+        # not sample count (same settings as the voltage curve)
+        for curve in (
+            self.curve_atp, self.curve_ca, self.curve_mito,
+            self.curve_integrity, self.curve_damage,
+        ):
+            curve.setDownsampling(auto=True, method="peak")
+            curve.setClipToView(True)
+            curve.setSkipFiniteCheck(True)
+
         self.meta_overview.setLayout(ov_layout)
 
         self.meta_detail = QWidget()
@@ -432,6 +770,9 @@ class MainWindow(QMainWindow):
         self.plot_meta_detail.setLabel("left", "Value", units="")
         self.plot_meta_detail.setLabel("bottom", "Time", units="s")
         self.curve_meta_detail = self.plot_meta_detail.plot(pen={"color": "#ffffff", "width": 1.5})
+        self.curve_meta_detail.setDownsampling(auto=True, method="peak")
+        self.curve_meta_detail.setClipToView(True)
+        self.curve_meta_detail.setSkipFiniteCheck(True)
 
         detail_layout.addWidget(self.btn_meta_back)
         detail_layout.addWidget(self.lbl_meta_detail_title)
@@ -446,6 +787,8 @@ class MainWindow(QMainWindow):
 
         self.tabs.addTab(self.tab_voltage, "Voltage")
         self.tabs.addTab(self.tab_meta, "Metabolism")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+        self.meta_stack.currentChanged.connect(self._on_meta_stack_changed)
 
         main_layout.addWidget(self.tabs, 1)
 
@@ -457,29 +800,59 @@ class MainWindow(QMainWindow):
 
     # control
 
+    @property
+    def time_ms(self):
+        # simulation clock lives in the worker; plain float read is safe
+        return self._worker.time_ms
+
     def set_time_scale(self, factor: float, label: str):
-        self.time_scale_factor = factor
+        self._worker.time_scale_factor = factor
         self.log(f"Time scale set to {label}.")
 
     def set_voltage_window(self, width_sec: float, label: str):
+        old_y = self._live_ybuf
+        n_old = old_y.shape[0]
+
         self.window_sec = width_sec
-        self.plot_buffer_size = int(self.window_sec * 1000 / self.plot_dt_ms)
-        old_t = list(self.t_data)
-        old_v = list(self.v_data)
-        self.t_data = deque(old_t[-self.plot_buffer_size:], maxlen=self.plot_buffer_size)
-        self.v_data = deque(old_v[-self.plot_buffer_size:], maxlen=self.plot_buffer_size)
+        m = int(width_sec * 1000 / self.plot_dt_ms)
+        self.plot_buffer_size = m
+        self._live_xbuf = np.linspace(0.0, width_sec, m, endpoint=False)
+
+        # index remap instead of a Python-level rebuild: carry the most
+        # recent samples over so changing the window doesn't blank the
+        # trace; slots are re-derived from the sample ticks, which keeps
+        # the time-phase lock intact in the new buffer
+        new_y = np.full(m, np.nan, dtype=np.float32)
+        last_tick = int(round(self._live_t_last * 1000.0 / self.plot_dt_ms))
+        keep = min(m - 1, n_old - 1)
+        if keep > 0 and last_tick > 0:
+            ticks = last_tick - np.arange(min(keep, last_tick + 1))
+            new_y[ticks % m] = old_y[ticks % n_old]
+        self._live_ybuf = new_y
+        self._live_head = last_tick % m
         self.log(f"Voltage window set to {label}.")
 
     # logging
 
     def log(self, msg: str):
         t_sim_sec = self.time_ms / 1000.0
-        self.log_widget.appendPlainText(f"[{t_sim_sec:7.3f} s] {msg}")
+        line = f"[{t_sim_sec:7.3f} s] {msg}"
+        if self._draw_timer.isActive():
+            self._log_queue.append(line)
+        else:
+            self.log_widget.appendPlainText(line)
+
+    def _flush_log(self):
+        if self._log_queue:
+            self.log_widget.appendPlainText("\n".join(self._log_queue))
+            self._log_queue.clear()
 
     def toggle_run(self):
         if self.running:
             self.running = False
-            self.timer.stop()
+            QMetaObject.invokeMethod(self._worker, "stop", Qt.QueuedConnection)
+            self._draw_timer.stop()
+            self._redraw()
             self.btn_start.setText("Start")
             self.log("Acquisition stopped.")
             self.voltage_plot.setMouseEnabled(x=True, y=True)
@@ -487,21 +860,19 @@ class MainWindow(QMainWindow):
             self.neuron.reset()
             self._reset_log_flags()
 
-            self.t_data.clear()
-            self.v_data.clear()
-            self.t_full.clear()
-            self.v_full.clear()
+            self._live_ybuf.fill(np.nan)
+            self._live_head = 0
+            self._live_t_last = 0.0
+            self.hist_ring.clear()
             self._apply_vm_history_limit()
 
-            self.meta_t.clear()
-            self.meta_atp.clear()
-            self.meta_ca.clear()
-            self.meta_mito.clear()
-            self.meta_integrity.clear()
-            self.meta_damage.clear()
+            self._meta_head = 0
+            self._meta_count = 0
 
-            self.time_ms = 0.0
-            self.time_since_last_plot = 0.0
+            QMetaObject.invokeMethod(
+                self._worker, "reset_clock", Qt.QueuedConnection
+            )
+            self._live_right = 0.0
             self.last_step_time_ms = None
             self.step_recovery_logged = False
 
@@ -511,22 +882,13 @@ class MainWindow(QMainWindow):
                 self.voltage_plot.setMouseEnabled(x=False, y=True)
 
             self.running = True
-            self.timer.start(self.timer_interval)
+            QMetaObject.invokeMethod(self._worker, "start", Qt.QueuedConnection)
+            self._draw_timer.start(self._draw_interval)
             self.btn_start.setText("Stop")
             self.log("Acquisition started.")
 
     def _reset_log_flags(self):
-        n = self.neuron
-        for attr in (
-            "flag_atp_low",
-            "flag_ca_high",
-            "flag_mito_stress",
-            "flag_integrity_low",
-            "flag_damage_high",
-            "flag_cascade",
-        ):
-            if hasattr(n, attr):
-                setattr(n, attr, False)
+        self.neuron.flags = 0
 
     def kill_cell(self):
         self.neuron.kill()
@@ -563,6 +925,15 @@ class MainWindow(QMainWindow):
 
     # metabolism view
 
+    def _meta_view(self, arr):
+        # oldest-to-newest view; zero-copy slice unless the ring has wrapped
+        if self._meta_count < self._meta_capacity:
+            return arr[:self._meta_count]
+        head = self._meta_head
+        if head == 0:
+            return arr
+        return np.concatenate((arr[head:], arr[:head]))
+
     def show_meta_detail(self, var_name: str):
         self.meta_detail_var = var_name
         self.lbl_meta_detail_title.setText(f"{var_name} detail")
@@ -573,83 +944,115 @@ class MainWindow(QMainWindow):
         self.meta_detail_var = None
         self.meta_stack.setCurrentIndex(0)
 
+    def _on_tab_changed(self, index):
+        if self.tabs.widget(index) is self.tab_meta and self._meta_dirty:
+            self._meta_dirty = False
+            self.update_meta_plots()
+
+    def _on_meta_stack_changed(self, index):
+        # refresh whichever page was just revealed
+        if self._meta_count:
+            self.update_meta_plots()
+
     def update_meta_plots(self):
-        if not self.meta_t:
+        if self._meta_count == 0:
             return
 
-        t = self.meta_t
-        self.curve_atp.setData(t, self.meta_atp)
-        self.curve_ca.setData(t, self.meta_ca)
-        self.curve_mito.setData(t, self.meta_mito)
-        self.curve_integrity.setData(t, self.meta_integrity)
-        self.curve_damage.setData(t, self.meta_damage)
-
-        if self.meta_detail_var is not None:
+        if self.meta_stack.currentIndex() == 0:
+            t = self._meta_view(self.meta_t)
+            self.curve_atp.setData(t, self._meta_view(self.meta_atp))
+            self.curve_ca.setData(t, self._meta_view(self.meta_ca))
+            self.curve_mito.setData(t, self._meta_view(self.meta_mito))
+            self.curve_integrity.setData(t, self._meta_view(self.meta_integrity))
+            self.curve_damage.setData(t, self._meta_view(self.meta_damage))
+        elif self.meta_detail_var is not None:
             self.update_meta_detail_plot()
 
     def update_meta_detail_plot(self):
-        if not self.meta_t:
+        if self._meta_count == 0:
             return
-        t = self.meta_t
         if self.meta_detail_var == "ATP":
-            y = self.meta_atp
+            arr = self.meta_atp
         elif self.meta_detail_var == "Ca":
-            y = self.meta_ca
+            arr = self.meta_ca
         elif self.meta_detail_var == "Mito":
-            y = self.meta_mito
+            arr = self.meta_mito
         elif self.meta_detail_var == "Integrity":
-            y = self.meta_integrity
+            arr = self.meta_integrity
         elif self.meta_detail_var == "Damage":
-            y = self.meta_damage
+            arr = self.meta_damage
         else:
             return
-        self.curve_meta_detail.setData(t, y)
+        self.curve_meta_detail.setData(self._meta_view(self.meta_t), self._meta_view(arr))
 
-    # main loop
+    # sample intake (queued from the worker thread)
 
-    def update_loop(self):
+    @Slot(object, object, object)
+    def _on_samples(self, ts, vs, meta):
         if not self.running:
             return
 
-        steps_to_run = int((self.timer_interval / self.dt) * self.time_scale_factor)
-        if steps_to_run == 0 and self.time_scale_factor > 0:
-            steps_to_run = 1
-
-        for _ in range(steps_to_run):
-            i_stim = self.stim.current_at(self.time_ms)
-            v_true = self.neuron.step(self.dt, i_stim, kill_mode=False)
-
-            self.time_ms += self.dt
-            self.time_since_last_plot += self.dt
-
-            if self.time_since_last_plot >= self.plot_dt_ms:
-                self.time_since_last_plot -= self.plot_dt_ms
-                v_meas = self.daq.acquire_sample(v_true)
-                t_sec = self.time_ms / 1000.0
-
-                self.t_data.append(t_sec)
-                self.v_data.append(v_meas)
-                self.t_full.append(t_sec)
-                self.v_full.append(v_meas)
-
-                self.meta_t.append(t_sec)
-                self.meta_atp.append(self.neuron.ATP)
-                self.meta_ca.append(self.neuron.Ca)
-                self.meta_mito.append(self.neuron.mito)
-                self.meta_integrity.append(self.neuron.integrity)
-                self.meta_damage.append(self.neuron.damage)
+        ybuf = self._live_ybuf
+        n_live = ybuf.shape[0]
+        pdt = self.plot_dt_ms
+        lhead = self._live_head
+        for k in range(ts.shape[0]):
+            t_sec = ts[k]
+            v = float(vs[k])
+            # slot from the timestamp, not a free-running counter, so the
+            # buffer phase can never drift from the time axis
+            lhead = int(round(t_sec * 1000.0 / pdt)) % n_live
+            ybuf[lhead] = v
+            ybuf[(lhead + 1) % n_live] = np.nan
+            self.hist_ring.append(t_sec, v)
+
+            head = self._meta_head
+            self.meta_t[head] = t_sec
+            self.meta_atp[head] = meta[0, k]
+            self.meta_ca[head] = meta[1, k]
+            self.meta_mito[head] = meta[2, k]
+            self.meta_integrity[head] = meta[3, k]
+            self.meta_damage[head] = meta[4, k]
+            self._meta_head = (head + 1) % self._meta_capacity
+            if self._meta_count < self._meta_capacity:
+                self._meta_count += 1
+
+        self._live_head = lhead
+        self._live_t_last = float(ts[-1])
+        self._dirty = True
+
+    def _redraw(self):
+        self._flush_log()
+        if not self._dirty:
+            return
+        self._dirty = False
 
         if self.voltage_view_mode == "HISTORY":
-            if self.t_full:
-                self.curve_vm.setData(x=list(self.t_full), y=list(self.v_full))
+            if self.hist_ring.count:
+                t, v = self.hist_ring.views()
+                self.curve_vm.setPos(0, 0)  # absolute times, no sweep offset
+                self.curve_vm.setData(x=t, y=v)
         else:
-            if self.t_data:
-                self.curve_vm.setData(x=list(self.t_data), y=list(self.v_data))
-                t_max = self.t_data[-1]
-                t_min = max(0.0, t_max - self.window_sec)
-                self.voltage_plot.setXRange(t_min, t_max, padding=0)
+            if self._live_t_last > 0.0:
+                # same two ndarrays every frame; the offset snaps in
+                # whole-window increments so slot times stay truthful for
+                # the current sweep (data right of the write head is the
+                # previous sweep, standard scope behavior)
+                self.curve_vm.setData(self._live_xbuf, self._live_ybuf)
+                window = self.window_sec
+                base = (self._live_t_last // window) * window
+                self.curve_vm.setPos(base, 0)
+                if base + window != self._live_right:
+                    self._live_right = base + window
+                    self.voltage_plot.setXRange(
+                        base, self._live_right, padding=0
+                    )
 
-        self.update_meta_plots()
+        # don't render curves the user can't see; catch up on tab switch
+        if self.tabs.currentWidget() is self.tab_meta:
+            self.update_meta_plots()
+        else:
+            self._meta_dirty = True
         self.update_status_labels()
         self.update_event_logs()
 
@@ -662,34 +1065,41 @@ class MainWindow(QMainWindow):
         if n.dead and self.running:
             self.log("EVENT: Cell has died.")
             self.running = False
-            self.timer.stop()
+            QMetaObject.invokeMethod(self._worker, "stop", Qt.QueuedConnection)
+            self._draw_timer.stop()
+            self._flush_log()
             self.btn_start.setText("Start")
             self.voltage_plot.setMouseEnabled(x=True, y=True)
             return
 
-        if n.ATP < 0.3 and not n.flag_atp_low:
-            self.log("WARNING: ATP levels critically low.")
-            n.flag_atp_low = True
+        # once every flag bit is set there is nothing left to test per frame
+        flags = n.flags
+        if flags != FLAG_ALL:
+            if n.ATP < 0.3 and not flags & FLAG_ATP_LOW:
+                self.log("WARNING: ATP levels critically low.")
+                flags |= FLAG_ATP_LOW
 
-        if n.Ca > 1.0 and not n.flag_ca_high:
-            self.log("WARNING: Intracellular Ca²⁺ overload developing.")
-            n.flag_ca_high = True
+            if n.Ca > 1.0 and not flags & FLAG_CA_HIGH:
+                self.log("WARNING: Intracellular Ca²⁺ overload developing.")
+                flags |= FLAG_CA_HIGH
 
-        if n.mito < 80.0 and not n.flag_mito_stress:
-            self.log("NOTICE: Mitochondrial output reduced.")
-            n.flag_mito_stress = True
+            if n.mito < 80.0 and not flags & FLAG_MITO_STRESS:
+                self.log("NOTICE: Mitochondrial output reduced.")
+                flags |= FLAG_MITO_STRESS
 
-        if n.integrity < 60.0 and not n.flag_integrity_low:
-            self.log("NOTICE: Structural integrity declining.")
-            n.flag_integrity_low = True
+            if n.integrity < 60.0 and not flags & FLAG_INTEGRITY_LOW:
+                self.log("NOTICE: Structural integrity declining.")
+                flags |= FLAG_INTEGRITY_LOW
 
-        if n.damage > 20.0 and not n.flag_damage_high:
-            self.log("WARNING: Permanent damage accumulating.")
-            n.flag_damage_high = True
+            if n.damage > 20.0 and not flags & FLAG_DAMAGE_HIGH:
+                self.log("WARNING: Permanent damage accumulating.")
+                flags |= FLAG_DAMAGE_HIGH
 
-        if n.ATP < 0.2 and n.Ca > 0.5 and stim_on and not n.flag_cascade:
-            self.log("DANGER: Excitotoxic cascade conditions reached.")
-            n.flag_cascade = True
+            if n.ATP < 0.2 and n.Ca > 0.5 and stim_on and not flags & FLAG_CASCADE:
+                self.log("DANGER: Excitotoxic cascade conditions reached.")
+                flags |= FLAG_CASCADE
+
+            n.flags = flags
 
         if (
             self.stim.mode == "STEP"
@@ -706,13 +1116,38 @@ class MainWindow(QMainWindow):
 
     def update_status_labels(self):
         n = self.neuron
-        self.lbl_vm.setText(f"Vm: {n.v:6.2f} mV")
-        self.lbl_health.setText(f"Health: {n.health:5.1f}%")
-        self.lbl_atp.setText(f"ATP: {n.ATP:4.2f}")
-        self.lbl_ca.setText(f"Ca²⁺: {n.Ca:4.2f}")
-        self.lbl_mito.setText(f"Mitochondria: {n.mito:5.1f}%")
-        self.lbl_integrity.setText(f"Integrity: {n.integrity:5.1f}%")
-        self.lbl_damage.setText(f"Damage: {n.damage:5.1f}%")
+        last = self._last_status
+
+        # only touch a label when its value changes at display precision;
+        # setText invalidates layout and queues a paint even for equal text
+        vm = round(n.v, 2)
+        if last.get("vm") != vm:
+            last["vm"] = vm
+            self.lbl_vm.setText(_FMT_VM % n.v)
+        health = round(n.health, 1)
+        if last.get("health") != health:
+            last["health"] = health
+            self.lbl_health.setText(_FMT_HEALTH % n.health)
+        atp = round(n.ATP, 2)
+        if last.get("atp") != atp:
+            last["atp"] = atp
+            self.lbl_atp.setText(_FMT_ATP % n.ATP)
+        ca = round(n.Ca, 2)
+        if last.get("ca") != ca:
+            last["ca"] = ca
+            self.lbl_ca.setText(_FMT_CA % n.Ca)
+        mito = round(n.mito, 1)
+        if last.get("mito") != mito:
+            last["mito"] = mito
+            self.lbl_mito.setText(_FMT_MITO % n.mito)
+        integrity = round(n.integrity, 1)
+        if last.get("integrity") != integrity:
+            last["integrity"] = integrity
+            self.lbl_integrity.setText(_FMT_INTEGRITY % n.integrity)
+        damage = round(n.damage, 1)
+        if last.get("damage") != damage:
+            last["damage"] = damage
+            self.lbl_damage.setText(_FMT_DAMAGE % n.damage)
 
         if n.dead:
             state = "DEAD"
@@ -730,8 +1165,14 @@ class MainWindow(QMainWindow):
             elif n.damage > 1.0:
                 color = "#ffd966"
 
-        self.lbl_state.setText(f"State: {state}")
-        self.lbl_state.setStyleSheet(f"color:{color}; font-weight:600;")
+        if last.get("state") != state:
+            last["state"] = state
+            self.lbl_state.setText(_FMT_STATE % state)
+        # setStyleSheet re-parses and re-polishes even for identical css
+        css = f"color:{color}; font-weight:600;"
+        if css != self._last_state_css:
+            self._last_state_css = css
+            self.lbl_state.setStyleSheet(css)
 
     def generate_report(self):
         n = self.neuron
@@ -751,18 +1192,36 @@ class MainWindow(QMainWindow):
         lines.append(f"Dead:            {'yes' if n.dead else 'no'}")
         lines.append("")
 
-        if self.meta_t:
+        if self._meta_count:
+            # ufunc reductions on the views, not Python min()/max() element
+            # loops — the history rings can hold hundreds of thousands of
+            # samples by report time
+            def _mm(buf):
+                arr = self._meta_view(buf)
+                return float(arr.min()), float(arr.max())
+
+            atp_lo, atp_hi = _mm(self.meta_atp)
+            ca_lo, ca_hi = _mm(self.meta_ca)
+            mito_lo, mito_hi = _mm(self.meta_mito)
+            integ_lo, integ_hi = _mm(self.meta_integrity)
+            dmg_lo, dmg_hi = _mm(self.meta_damage)
             lines.append("Metabolic ranges (over full run):")
-            lines.append(f"  ATP:       {min(self.meta_atp):.3f} – {max(self.meta_atp):.3f}")
-            lines.append(f"  Ca²⁺:      {min(self.meta_ca):.3f} – {max(self.meta_ca):.3f}")
-            lines.append(f"  Mito:      {min(self.meta_mito):.1f} – {max(self.meta_mito):.1f} %")
-            lines.append(f"  Integrity: {min(self.meta_integrity):.1f} – {max(self.meta_integrity):.1f} %")
-            lines.append(f"  Damage:    {min(self.meta_damage):.1f} – {max(self.meta_damage):.1f} %")
+            lines.append(f"  ATP:       {atp_lo:.3f} – {atp_hi:.3f}")
+            lines.append(f"  Ca²⁺:      {ca_lo:.3f} – {ca_hi:.3f}")
+            lines.append(f"  Mito:      {mito_lo:.1f} – {mito_hi:.1f} %")
+            lines.append(f"  Integrity: {integ_lo:.1f} – {integ_hi:.1f} %")
+            lines.append(f"  Damage:    {dmg_lo:.1f} – {dmg_hi:.1f} %")
         else:
             lines.append("No metabolic history recorded yet.")
 
         self.log_widget.appendPlainText("\n".join(lines))
 
+    def closeEvent(self, event):
+        QMetaObject.invokeMethod(self._worker, "stop", Qt.QueuedConnection)
+        self._sim_thread.quit()
+        self._sim_thread.wait(2000)
+        super().closeEvent(event)
+
     def show_about(self):
         QMessageBox.about(
             self,
@@ -1,12 +1,78 @@
 import math
-import random
+
+import numpy as np
+
+# rate lookup tables: the six alpha/beta functions depend on v only and v
+# stays inside a bounded physiological range, so they are evaluated once
+# per 0.05 mV bin at import and looked up per step instead of calling
+# math.exp six times per tick (tables built below the class)
+_V_MIN = -100.0
+_V_MAX = 80.0
+_V_STEP = 0.05
+_INV_V_STEP = 1.0 / _V_STEP
+_TAB_LAST = int((_V_MAX - _V_MIN) / _V_STEP)
+
+# event-flag bits, packed into Neuron.flags (one int instead of six
+# boolean attributes; the population keeps them as a uint8 column)
+FLAG_ATP_LOW = 1 << 0
+FLAG_CA_HIGH = 1 << 1
+FLAG_MITO_STRESS = 1 << 2
+FLAG_INTEGRITY_LOW = 1 << 3
+FLAG_DAMAGE_HIGH = 1 << 4
+FLAG_CASCADE = 1 << 5
+FLAG_ALL = (1 << 6) - 1
 
 
 class Neuron:
+    # no per-instance __dict__: slot reads are cheaper than dict lookups
+    # and a population of scalar cells stops paying ~500 bytes each
+    __slots__ = (
+        "q10", "v", "prev_v", "m", "h", "n", "w",
+        "ATP", "mito", "Ca", "integrity", "damage", "health", "dead",
+        "_t", "_kill_eta", "flags",
+    )
+
+    # dead-branch noise, drawn in blocks and shared across instances:
+    # random.gauss costs a log and a sqrt per call and runs every tick
+    # forever once a cell has died
+    _NOISE_N = 4096
+    _noise_rng = np.random.default_rng()
+    _noise_buf = None
+    _noise_idx = 0
+
+    # free-list of retired instances for tight construct/discard loops
+    # (batch sweeps); acquire() recycles one via reset() instead of
+    # re-running __init__ and the allocator
+    _pool = []
+
     def __init__(self, temp_c: float = 37.0):
         self.q10 = 1.0
         self.reset()
 
+    @classmethod
+    def acquire(cls):
+        if cls._pool:
+            neuron = cls._pool.pop()
+            neuron.q10 = 1.0
+            neuron.reset()
+            return neuron
+        return cls()
+
+    def release(self):
+        Neuron._pool.append(self)
+
+    @classmethod
+    def _next_noise(cls):
+        if cls._noise_buf is None or cls._noise_idx >= cls._NOISE_N:
+            # tolist so the hot path indexes plain floats, not np scalars
+            cls._noise_buf = (
+                cls._noise_rng.standard_normal(cls._NOISE_N) * 0.5
+            ).tolist()
+            cls._noise_idx = 0
+        val = cls._noise_buf[cls._noise_idx]
+        cls._noise_idx += 1
+        return val
+
     def reset(self):
         self.v = -65.0
         self.prev_v = self.v
@@ -27,12 +93,11 @@ class Neuron:
         self.health = 100.0
         self.dead = False
 
-        self.flag_atp_low = False
-        self.flag_ca_high = False
-        self.flag_mito_stress = False
-        self.flag_integrity_low = False
-        self.flag_damage_high = False
-        self.flag_cascade = False
+        # internal clock (s) and forced-collapse deadline (see step)
+        self._t = 0.0
+        self._kill_eta = None
+
+        self.flags = 0
 
     # hh rates
 
@@ -70,36 +135,54 @@ class Neuron:
 
     def step(self, dt_ms: float, i_ext: float, kill_mode: bool = False) -> float:
         dt_sec = dt_ms / 1000.0
+        self._t += dt_sec
 
-        # forced collapse
+        # forced collapse: the old per-tick ATP/Ca/damage decay was linear,
+        # so the first lethal threshold crossing has a closed form — compute
+        # the deadline once and just compare the clock until then
         if kill_mode and not self.dead:
-            self.ATP -= 5.0 * dt_sec
-            self.Ca += 2.0 * dt_sec
-            self.damage += 5.0 * dt_sec
-            if self.ATP <= 0.0 or self.damage >= 100.0 or self.Ca > 20.0:
+            if self._kill_eta is None:
+                self._kill_eta = self._t + min(
+                    self.ATP / 5.0,
+                    (100.0 - self.damage) / 5.0,
+                    (20.0 - self.Ca) / 2.0,
+                )
+            elif self._t >= self._kill_eta:
                 self.kill()
+                self._kill_eta = None
+        elif self._kill_eta is not None:
+            self._kill_eta = None
 
         if self.dead:
-            self.v += (0.0 - self.v) * dt_sec * 0.2 + random.gauss(0.0, 0.5)
+            self.v += (0.0 - self.v) * dt_sec * 0.2 + Neuron._next_noise()
             return self.v
 
+        # hoist state into locals: the body below would otherwise do ~40
+        # attribute loads/stores per tick, each a descriptor dispatch
         v = self.v
-
-        # membrane
-        am = self._alpha_m(v)
-        bm = self._beta_m(v)
-        ah = self._alpha_h(v)
-        bh = self._beta_h(v)
-        an = self._alpha_n(v)
-        bn = self._beta_n(v)
-
-        self.m += (am * (1.0 - self.m) - bm * self.m) * dt_ms * 0.5
-        self.h += (ah * (1.0 - self.h) - bh * self.h) * dt_ms * 0.5
-        self.n += (an * (1.0 - self.n) - bn * self.n) * dt_ms * 0.5
-
-        self.m = max(0.0, min(1.0, self.m))
-        self.h = max(0.0, min(1.0, self.h))
-        self.n = max(0.0, min(1.0, self.n))
+        ATP = self.ATP
+        Ca = self.Ca
+        mito = self.mito
+
+        # membrane: quantized table lookup instead of per-tick exp calls
+        idx = int((v - _V_MIN) * _INV_V_STEP)
+        if idx < 0:
+            idx = 0
+        elif idx > _TAB_LAST:
+            idx = _TAB_LAST
+
+        # Rush-Larsen exponential Euler: A-stable, keeps gates in [0,1]
+        # analytically, so no clamp and no small-dt damping factor
+        em, eh, en = _gate_exp_tables(dt_ms)[0]
+        m_inf = _MINF[idx]
+        h_inf = _HINF[idx]
+        n_inf = _NINF[idx]
+        m = m_inf + (self.m - m_inf) * em[idx]
+        h = h_inf + (self.h - h_inf) * eh[idx]
+        n = n_inf + (self.n - n_inf) * en[idx]
+        self.m = m
+        self.h = h
+        self.n = n
 
         gNa = 120.0
         gK = 36.0
@@ -109,76 +192,145 @@ class Neuron:
         EK = -77.0
         EL = -54.4
 
-        INa = gNa * (self.m ** 3) * self.h * (v - ENa)
-        IK = gK * (self.n ** 4) * (v - EK)
+        # small integer powers by explicit multiplies; pow() is a libm
+        # call, these are two flops each
+        m2 = m * m
+        n2 = n * n
+        INa = gNa * (m2 * m) * h * (v - ENa)
+        IK = gK * (n2 * n2) * (v - EK)
         IL = gL * (v - EL)
 
-        dv = (i_ext - INa - IK - IL)
-        self.v += dv * dt_ms
+        v_new = v + (i_ext - INa - IK - IL) * dt_ms
 
         # pump
-        pump_strength = 0.004 * self.ATP
-        self.v += (-65.0 - self.v) * pump_strength * dt_ms
+        pump_strength = 0.004 * ATP
+        v_new += (-65.0 - v_new) * pump_strength * dt_ms
 
-        spike = (self.prev_v < 0.0 <= self.v)
+        spike = (self.prev_v < 0.0 <= v_new)
 
         # calcium
         if spike:
-            self.Ca += 0.02
+            Ca += 0.02
 
-        ca_clear_rate = 0.05 + 2.0 * self.ATP
-        self.Ca -= self.Ca * ca_clear_rate * dt_sec
-        if self.Ca < 0.0:
-            self.Ca = 0.0
+        ca_clear_rate = 0.05 + 2.0 * ATP
+        Ca -= Ca * ca_clear_rate * dt_sec
+        if Ca < 0.0:
+            Ca = 0.0
 
         # atp
-        prod_rate = 0.008 * (self.mito / 100.0)
+        prod_rate = 0.008 * (mito / 100.0)
         pump_cost_rate = 0.0007 * abs(i_ext)
-        ca_cost_rate = 0.006 * self.Ca
+        ca_cost_rate = 0.006 * Ca
 
-        self.ATP += (prod_rate - pump_cost_rate - ca_cost_rate) * dt_sec
-        self.ATP = max(0.0, min(1.0, self.ATP))
+        atp = ATP + (prod_rate - pump_cost_rate - ca_cost_rate) * dt_sec
+        ATP = 0.0 if atp < 0.0 else (1.0 if atp > 1.0 else atp)
 
-        if self.ATP <= 0.001:
-            self.kill()
+        if ATP <= 0.001:
+            self.Ca = Ca
             self.prev_v = v
+            self.kill()
             return self.v
 
         # mitochondria
-        mito_recovery_rate = 0.02 * (100.0 - self.mito)
+        mito_recovery_rate = 0.02 * (100.0 - mito)
         load_term = max(0.0, abs(i_ext) - 15.0) * 0.0005
-        ca_term = max(0.0, self.Ca - 0.3) * 0.1
+        ca_term = max(0.0, Ca - 0.3) * 0.1
 
-        self.mito += (mito_recovery_rate - load_term - ca_term) * dt_sec
-        self.mito = max(0.0, min(100.0, self.mito))
+        mito = mito + (mito_recovery_rate - load_term - ca_term) * dt_sec
+        mito = 0.0 if mito < 0.0 else (100.0 if mito > 100.0 else mito)
 
         # damage / health
-        voltage_term = abs(self.v + 65.0) / 250.0
-        ca_term = 1.5 * self.Ca
-        atp_term = 1.5 * (1.0 - self.ATP)
-        mito_term = (100.0 - self.mito) / 100.0
+        voltage_term = abs(v_new + 65.0) / 250.0
+        ca_term = 1.5 * Ca
+        atp_term = 1.5 * (1.0 - ATP)
+        mito_term = (100.0 - mito) / 100.0
 
         stress = voltage_term + ca_term + atp_term + mito_term
 
+        integrity = self.integrity
         if stress < 0.6:
-            self.integrity += 0.1 * dt_sec
+            integrity += 0.1 * dt_sec
         else:
-            self.integrity -= (stress - 0.6) * dt_sec
-
-        self.integrity = max(0.0, min(100.0, self.integrity))
+            integrity -= (stress - 0.6) * dt_sec
+        integrity = 0.0 if integrity < 0.0 else (100.0 if integrity > 100.0 else integrity)
 
+        damage = self.damage
         if stress > 1.0:
-            self.damage += (stress - 1.0) * 0.5 * dt_sec
-
-        self.damage = max(0.0, min(100.0, self.damage))
+            damage += (stress - 1.0) * 0.5 * dt_sec
+        damage = 0.0 if damage < 0.0 else (100.0 if damage > 100.0 else damage)
 
-        self.health = self.integrity - 0.7 * self.damage
-        self.health = max(0.0, min(100.0, self.health))
+        health = integrity - 0.7 * damage
+        health = 0.0 if health < 0.0 else (100.0 if health > 100.0 else health)
 
-        if self.health <= 0.0:
+        # single store-back of the mutated state
+        self.v = v_new
+        self.prev_v = v
+        self.ATP = ATP
+        self.Ca = Ca
+        self.mito = mito
+        self.integrity = integrity
+        self.damage = damage
+        self.health = health
+
+        if health <= 0.0:
             self.kill()
-            self.prev_v = v
             return self.v
 
-        self.prev_v = v
-        return self.v
+        return v_new
+
+
+def _build_rate_tables():
+    # evaluate the reference _alpha_*/_beta_* formulas per voltage bin;
+    # the bins for the two removable singularities are overwritten with
+    # their analytic limits
+    ref = Neuron.__new__(Neuron)
+    vs = [_V_MIN + i * _V_STEP for i in range(_TAB_LAST + 1)]
+
+    am = [ref._alpha_m(v) for v in vs]
+    bm = [ref._beta_m(v) for v in vs]
+    ah = [ref._alpha_h(v) for v in vs]
+    bh = [ref._beta_h(v) for v in vs]
+    an = [ref._alpha_n(v) for v in vs]
+    bn = [ref._beta_n(v) for v in vs]
+
+    am[int(round((-40.0 - _V_MIN) * _INV_V_STEP))] = 1.0
+    an[int(round((-55.0 - _V_MIN) * _INV_V_STEP))] = 0.1
+    return am, bm, ah, bh, an, bn
+
+
+# plain lists for the scalar step (unboxed float indexing); the ndarray
+# copies serve the vectorized population via fancy indexing
+_AM, _BM, _AH, _BH, _AN, _BN = _build_rate_tables()
+
+# Rush-Larsen per-bin constants: steady state and rate sum per gate
+_MINF = [a / (a + b) for a, b in zip(_AM, _BM)]
+_HINF = [a / (a + b) for a, b in zip(_AH, _BH)]
+_NINF = [a / (a + b) for a, b in zip(_AN, _BN)]
+_SUM_M = np.array([a + b for a, b in zip(_AM, _BM)])
+_SUM_H = np.array([a + b for a, b in zip(_AH, _BH)])
+_SUM_N = np.array([a + b for a, b in zip(_AN, _BN)])
+_MINF_TAB = np.array(_MINF, dtype=np.float32)
+_HINF_TAB = np.array(_HINF, dtype=np.float32)
+_NINF_TAB = np.array(_NINF, dtype=np.float32)
+
+# exp(-dt*(alpha+beta)) per bin, cached per dt: dt is fixed within a
+# session, so each dt value pays for its tables once
+_gate_exp_cache = {}
+
+
+def _gate_exp_tables(dt_ms):
+    tabs = _gate_exp_cache.get(dt_ms)
+    if tabs is None:
+        em = np.exp(-dt_ms * _SUM_M)
+        eh = np.exp(-dt_ms * _SUM_H)
+        en = np.exp(-dt_ms * _SUM_N)
+        tabs = (
+            (em.tolist(), eh.tolist(), en.tolist()),
+            (
+                em.astype(np.float32),
+                eh.astype(np.float32),
+                en.astype(np.float32),
+            ),
+        )
+        _gate_exp_cache[dt_ms] = tabs
+    return tabs
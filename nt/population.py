@@ -0,0 +1,319 @@
+"""Vectorized neuron population.
+
+NeuronPopulation steps N independent copies of the nt/neuron.py cell
+model with structure-of-arrays ndarray ops (one contiguous float32
+array per state variable, the CoreNEURON layout), so a population tick
+costs a handful of ufunc calls instead of N interpreted step() calls.
+
+The scalar Neuron stays the single-cell reference implementation; the
+dynamics here must remain in sync with it and with nt/_kernels.py.
+
+Storage is partitioned: slots [:n_alive] hold live neurons and the tail
+holds dead ones, so the hot math runs on dense alive slices and the
+dead-noise relaxation on one tail slice, with no per-step masking. A
+kill swaps the victim's row to the tail; _order maps each storage slot
+back to its construction-order index (see in_original_order).
+"""
+
+import numpy as np
+
+try:
+    # optional middle backend: fuses big elementwise expressions into
+    # cache-blocked threaded passes; preference order is numba > numexpr >
+    # plain ufuncs
+    import numexpr as _ne
+    _HAVE_NUMEXPR = True
+except ImportError:
+    _HAVE_NUMEXPR = False
+
+from . import _jax_kernel, _kernels
+from .neuron import (
+    _MINF_TAB, _HINF_TAB, _NINF_TAB, _gate_exp_tables,
+    _V_MIN, _INV_V_STEP, _TAB_LAST,
+    FLAG_ATP_LOW, FLAG_CA_HIGH, FLAG_MITO_STRESS,
+    FLAG_INTEGRITY_LOW, FLAG_DAMAGE_HIGH, FLAG_CASCADE,
+)
+
+
+class NeuronPopulation:
+
+    _NOISE_N = 4096
+
+    def __init__(self, n: int, backend: str = "auto"):
+        self.n = int(n)
+        # "jax" routes step() through the XLA kernel when jax is
+        # installed; "auto" keeps the numba > numexpr > ufunc order
+        if backend == "jax" and not _jax_kernel.HAVE_JAX:
+            backend = "auto"
+        self._backend = backend
+        self._rng = np.random.default_rng()
+        # dead-branch noise ring, refilled in blocks (empty-at-start so the
+        # first draw fills it)
+        self._noise = np.empty(self._NOISE_N, dtype=np.float32)
+        self._noise_idx = self._NOISE_N
+        self.reset()
+
+    def _dead_noise(self, count):
+        buf = self._noise
+        if count > buf.shape[0]:
+            return self._rng.standard_normal(count, dtype=np.float32)
+        if self._noise_idx + count > buf.shape[0]:
+            self._rng.standard_normal(dtype=np.float32, out=buf)
+            self._noise_idx = 0
+        out = buf[self._noise_idx:self._noise_idx + count]
+        self._noise_idx += count
+        return out
+
+    def reset(self):
+        n = self.n
+        # alive/dead partition: everything below n_alive is live, and
+        # _order[slot] is the construction-order index stored there
+        self.n_alive = n
+        self._order = np.arange(n)
+
+        self.v = np.full(n, -65.0, dtype=np.float32)
+        self.prev_v = self.v.copy()
+
+        # hh gating
+        self.m = np.full(n, 0.05, dtype=np.float32)
+        self.h = np.full(n, 0.6, dtype=np.float32)
+        self.n_gate = np.full(n, 0.32, dtype=np.float32)
+
+        # metabolism / structure
+        self.ATP = np.full(n, 1.0, dtype=np.float32)
+        self.mito = np.full(n, 100.0, dtype=np.float32)
+        self.Ca = np.zeros(n, dtype=np.float32)
+        self.integrity = np.full(n, 100.0, dtype=np.float32)
+        self.damage = np.zeros(n, dtype=np.float32)
+        self.health = np.full(n, 100.0, dtype=np.float32)
+        self.dead = np.zeros(n, dtype=bool)
+        # sticky event-flag bits, same layout as Neuron.flags
+        self.flags = np.zeros(n, dtype=np.uint8)
+
+    def update_flags(self, stim_on: bool = False):
+        # recompute the six event bits in fused array passes; bits are
+        # sticky (OR-accumulated), matching the scalar event log behavior
+        f = (self.ATP < 0.3).astype(np.uint8) * np.uint8(FLAG_ATP_LOW)
+        f |= (self.Ca > 1.0).astype(np.uint8) * np.uint8(FLAG_CA_HIGH)
+        f |= (self.mito < 80.0).astype(np.uint8) * np.uint8(FLAG_MITO_STRESS)
+        f |= (self.integrity < 60.0).astype(np.uint8) * np.uint8(FLAG_INTEGRITY_LOW)
+        f |= (self.damage > 20.0).astype(np.uint8) * np.uint8(FLAG_DAMAGE_HIGH)
+        if stim_on:
+            f |= ((self.ATP < 0.2) & (self.Ca > 0.5)).astype(np.uint8) * np.uint8(FLAG_CASCADE)
+        self.flags |= f
+
+    def _state_arrays(self):
+        return (
+            self.v, self.prev_v, self.m, self.h, self.n_gate,
+            self.ATP, self.mito, self.Ca,
+            self.integrity, self.damage, self.health,
+            self.dead, self.flags, self._order,
+        )
+
+    def _partition(self, mask):
+        # move the flagged (newly dead) slots of [:n_alive] into the dead
+        # tail by swapping rows; fancy-index RHS evaluates to copies, so
+        # the paired assignment is a real swap
+        slots = np.nonzero(mask)[0]
+        if slots.size == 0:
+            return
+        new_n = self.n_alive - slots.size
+        head_killed = slots[slots < new_n]
+        if head_killed.size:
+            tail = np.arange(new_n, self.n_alive)
+            tail_alive = tail[~mask[new_n:self.n_alive]]
+            for a in self._state_arrays():
+                a[head_killed], a[tail_alive] = a[tail_alive], a[head_killed]
+        self.n_alive = new_n
+
+    def in_original_order(self, arr):
+        # view a state array in construction order, undoing the kill swaps
+        out = np.empty_like(arr)
+        out[self._order] = arr
+        return out
+
+    def kill(self, mask):
+        mask = np.asarray(mask, dtype=bool)[:self.n_alive]
+        if not mask.any():
+            return
+        na = self.n_alive
+        self.dead[:na][mask] = True
+        self.v[:na][mask] = 0.0
+        self.integrity[:na][mask] = 0.0
+        self.damage[:na][mask] = 100.0
+        self.health[:na][mask] = 0.0
+        self.ATP[:na][mask] = 0.0
+        self.mito[:na][mask] = 0.0
+        self.Ca[:na][mask] = 10.0
+        self._partition(mask)
+
+    def step(self, dt_ms: float, i_ext):
+        dt_sec = dt_ms / 1000.0
+        na = self.n_alive
+        i_ext = np.broadcast_to(
+            np.asarray(i_ext, dtype=np.float32), (self.n,)
+        )
+
+        if self._backend == "jax":
+            # functional kernel over the full arrays (dead lanes are
+            # where-selected in-kernel, so no partition slicing); the
+            # state round-trips through the device every call
+            noise = self._dead_noise(self.n)
+            state = (
+                self.v, self.prev_v, self.m, self.h, self.n_gate,
+                self.ATP, self.mito, self.Ca,
+                self.integrity, self.damage, self.health, self.dead,
+            )
+            out = _jax_kernel.step_pop_jax(
+                *state, np.ascontiguousarray(i_ext), dt_ms, noise
+            )
+            for arr, new in zip(state, out):
+                arr[:] = np.asarray(new)
+            newly_dead = self.dead[:na]
+            if newly_dead.any():
+                self._partition(newly_dead)
+            return self.v
+
+        if na < self.n:
+            # dead membranes relax toward 0 mV with measurement noise;
+            # one dense pass over the tail slice
+            vd = self.v[na:]
+            vd += (0.0 - vd) * np.float32(dt_sec * 0.2)
+            vd += self._dead_noise(vd.shape[0]) * np.float32(0.5)
+        if na == 0:
+            return self.v
+
+        if _kernels.HAVE_NUMBA:
+            # compiled per-neuron loop over the alive slice, split across
+            # cores with prange; in-kernel kills break the partition, so
+            # re-partition afterwards
+            _kernels.step_pop(
+                self.v[:na], self.prev_v[:na], self.m[:na], self.h[:na],
+                self.n_gate[:na],
+                self.ATP[:na], self.mito[:na], self.Ca[:na],
+                self.integrity[:na], self.damage[:na], self.health[:na],
+                self.dead[:na], np.ascontiguousarray(i_ext[:na]), dt_ms,
+            )
+            newly_dead = self.dead[:na]
+            if newly_dead.any():
+                self._partition(newly_dead)
+            return self.v
+
+        prev_v = self.prev_v[:na]
+        m, h, ng = self.m[:na], self.h[:na], self.n_gate[:na]
+        ATP, mito, Ca = self.ATP[:na], self.mito[:na], self.Ca[:na]
+        integrity = self.integrity[:na]
+        damage = self.damage[:na]
+        health = self.health[:na]
+        i_ext = i_ext[:na]
+
+        v = self.v[:na].copy()
+        v_arr = self.v[:na]
+
+        # membrane: Rush-Larsen exponential Euler from the shared quantized
+        # tables — m = m_inf + (m - m_inf)*exp(-dt*(am+bm)), evaluated with
+        # gathers and in-place ufuncs; gates stay in [0,1] analytically
+        idx = np.clip(
+            ((v - _V_MIN) * _INV_V_STEP).astype(np.int32), 0, _TAB_LAST
+        )
+        em, eh, en = _gate_exp_tables(dt_ms)[1]
+        m_inf = _MINF_TAB[idx]
+        h_inf = _HINF_TAB[idx]
+        n_inf = _NINF_TAB[idx]
+
+        for gate, g_inf, g_exp in (
+            (m, m_inf, em), (h, h_inf, eh), (ng, n_inf, en),
+        ):
+            np.subtract(gate, g_inf, out=gate)
+            np.multiply(gate, g_exp[idx], out=gate)
+            np.add(gate, g_inf, out=gate)
+
+        gNa = 120.0
+        gK = 36.0
+        gL = 0.5
+
+        ENa = 50.0
+        EK = -77.0
+        EL = -54.4
+
+        if _HAVE_NUMEXPR:
+            # one fused pass over the membrane currents instead of the
+            # temporaries INa/IK/IL would materialize
+            v_arr += _ne.evaluate(
+                "(i_ext - gNa*(m*m*m)*h*(v - ENa)"
+                " - gK*(ng*ng*ng*ng)*(v - EK) - gL*(v - EL)) * dt_ms"
+            )
+        else:
+            # explicit multiplies: elementwise pow over the population is
+            # far slower than two extra multiply passes
+            m2 = m * m
+            n2 = ng * ng
+            INa = gNa * (m2 * m) * h * (v - ENa)
+            IK = gK * (n2 * n2) * (v - EK)
+            IL = gL * (v - EL)
+            v_arr += (i_ext - INa - IK - IL) * dt_ms
+
+        # pump
+        pump_strength = 0.004 * ATP
+        v_arr += (-65.0 - v_arr) * pump_strength * dt_ms
+
+        spike = (prev_v < 0.0) & (v_arr >= 0.0)
+
+        # calcium
+        Ca[spike] += 0.02
+
+        ca_clear_rate = 0.05 + 2.0 * ATP
+        Ca -= Ca * ca_clear_rate * dt_sec
+        np.clip(Ca, 0.0, None, out=Ca)
+
+        # atp
+        prod_rate = 0.008 * (mito / 100.0)
+        pump_cost_rate = 0.0007 * np.abs(i_ext)
+        ca_cost_rate = 0.006 * Ca
+
+        ATP += (prod_rate - pump_cost_rate - ca_cost_rate) * dt_sec
+        np.clip(ATP, 0.0, 1.0, out=ATP)
+
+        atp_killed = ATP <= 0.001
+
+        # mitochondria
+        mito_recovery_rate = 0.02 * (100.0 - mito)
+        load_term = np.maximum(0.0, np.abs(i_ext) - 15.0) * 0.0005
+        ca_term = np.maximum(0.0, Ca - 0.3) * 0.1
+
+        mito += (mito_recovery_rate - load_term - ca_term) * dt_sec
+        np.clip(mito, 0.0, 100.0, out=mito)
+
+        # damage / health
+        if _HAVE_NUMEXPR:
+            vv, ca, atp = v_arr, Ca, ATP
+            stress = _ne.evaluate(
+                "abs(vv + 65.0)/250.0 + 1.5*ca"
+                " + 1.5*(1.0 - atp) + (100.0 - mito)/100.0"
+            )
+        else:
+            voltage_term = np.abs(v_arr + 65.0) / 250.0
+            ca_term = 1.5 * Ca
+            atp_term = 1.5 * (1.0 - ATP)
+            mito_term = (100.0 - mito) / 100.0
+            stress = voltage_term + ca_term + atp_term + mito_term
+
+        integrity += np.where(
+            stress < 0.6, 0.1 * dt_sec, -(stress - 0.6) * dt_sec
+        ).astype(np.float32)
+        np.clip(integrity, 0.0, 100.0, out=integrity)
+
+        damage += np.where(
+            stress > 1.0, (stress - 1.0) * (0.5 * dt_sec), 0.0
+        ).astype(np.float32)
+        np.clip(damage, 0.0, 100.0, out=damage)
+
+        np.clip(integrity - 0.7 * damage, 0.0, 100.0, out=health)
+
+        health_killed = health <= 0.0
+
+        # commit prev_v before kill() swaps rows around
+        prev_v[:] = v
+        self.kill(atp_killed | health_killed)
+
+        return self.v
@@ -1,3 +1,8 @@
+import math
+
+import numpy as np
+
+
 class Stimulator:
     MODES = ["OFF", "CONSTANT", "STEP", "PULSE"]
 
@@ -7,8 +12,8 @@ class Stimulator:
         # parameters
         self.amplitude = 10.0
         self.duration = 500.0
-        self.frequency = 10.0
-        self.pulse_width = 5.0
+        self._frequency = 10.0
+        self._pulse_width = 5.0
 
         self.protocol_start_time = 0.0
 
@@ -17,11 +22,69 @@ class Stimulator:
         self.step_start_time = 0.0
         self.step_duration = 5.0
 
+        # integer-tick scheduling (see set_dt)
+        self._dt_ms = None
+        self._period_ticks = 0
+        self._width_ticks = 0
+        self._start_tick = 0
+
+        self._recompute_pulse()
+
+    def _recompute_pulse(self):
+        # derived pulse constants, hoisted out of the per-call path;
+        # recomputed only when frequency or pulse width change
+        if self._frequency > 0.0:
+            self._period = 1000.0 / self._frequency
+            self._inv_period = self._frequency / 1000.0
+            self._width = min(self._pulse_width, self._period)
+        else:
+            self._period = 0.0
+            self._inv_period = 0.0
+            self._width = 0.0
+        self._recompute_ticks()
+
+    def _recompute_ticks(self):
+        if self._dt_ms and self._period > 0.0:
+            self._period_ticks = max(1, int(round(self._period / self._dt_ms)))
+            self._width_ticks = min(
+                int(round(self._pulse_width / self._dt_ms)), self._period_ticks
+            )
+        else:
+            self._period_ticks = 0
+            self._width_ticks = 0
+
+    def set_dt(self, dt_ms: float):
+        # fix the simulation step so PULSE scheduling can run on integer
+        # tick counts: bit-exact over long runs, and integer % is cheaper
+        # than the float phase math
+        self._dt_ms = dt_ms
+        self._recompute_ticks()
+
+    @property
+    def frequency(self):
+        return self._frequency
+
+    @frequency.setter
+    def frequency(self, value):
+        self._frequency = value
+        self._recompute_pulse()
+
+    @property
+    def pulse_width(self):
+        return self._pulse_width
+
+    @pulse_width.setter
+    def pulse_width(self, value):
+        self._pulse_width = value
+        self._recompute_pulse()
+
     def set_mode(self, mode, current_time=0.0):
         if mode in self.MODES:
             self.mode = mode
             self.protocol_start_time = current_time
             self.step_active = False
+            if self._dt_ms:
+                self._start_tick = int(round(current_time / self._dt_ms))
 
     def trigger_step(self, current_time: float):
         self.step_active = True
@@ -50,18 +113,80 @@ class Stimulator:
             return self.amplitude
 
         if self.mode == "PULSE":
-            if self.frequency <= 0.0 or rel_t < 0.0:
+            if self._period <= 0.0 or rel_t < 0.0:
                 return 0.0
+            # phase via floor on the cached reciprocal, no % and no min
+            phase = rel_t - math.floor(rel_t * self._inv_period) * self._period
+            if phase < self._width:
+                return self.amplitude
+            return 0.0
+
+        return 0.0
+
+    def current_at_tick(self, k: int) -> float:
+        # integer-tick variant of current_at for fixed-dt loops; STEP and
+        # PULSE need a prior set_dt call to place ticks in time, and
+        # deliver nothing until one is made
+        if self.mode == "OFF":
+            return 0.0
 
-            period = 1000.0 / self.frequency
-            if period <= 0.0:
+        if self.mode == "CONSTANT":
+            return self.amplitude
+
+        if self.mode == "STEP":
+            if self._dt_ms is None:
                 return 0.0
+            return self._step_current(k * self._dt_ms)
 
-            width = min(self.pulse_width, period)
-            phase = rel_t % period
-            if phase < width:
-                return self.amplitude
-            else:
+        if self.mode == "PULSE":
+            if self._period_ticks <= 0:
                 return 0.0
+            rel = k - self._start_tick
+            if rel >= 0 and rel % self._period_ticks < self._width_ticks:
+                return self.amplitude
+            return 0.0
 
         return 0.0
+
+    def current_at_array(self, t):
+        # vectorized current_at over an explicit array of times (ms);
+        # same semantics, including STEP auto-deactivation past the pulse
+        t = np.asarray(t, dtype=np.float64)
+        n = t.shape[0]
+
+        if self.mode == "OFF":
+            return np.zeros(n)
+
+        if self.mode == "CONSTANT":
+            return np.full(n, self.amplitude)
+
+        if self.mode == "STEP":
+            if not self.step_active:
+                return np.zeros(n)
+            rel = t - self.step_start_time
+            out = np.where(
+                (rel >= 0.0) & (rel < self.step_duration), self.amplitude, 0.0
+            )
+            if rel[-1] >= self.step_duration:
+                self.step_active = False
+            return out
+
+        if self.mode == "PULSE":
+            if self._period <= 0.0:
+                return np.zeros(n)
+            rel_t = t - self.protocol_start_time
+            phase = rel_t - np.floor(rel_t * self._inv_period) * self._period
+            return np.where(
+                (rel_t >= 0.0) & (phase < self._width), self.amplitude, 0.0
+            )
+
+        return np.zeros(n)
+
+    def current_array(self, t0_ms, dt_ms, n):
+        # injected current over n substeps starting at t0_ms, as one array;
+        # same semantics as calling current_at per step
+        if self.mode == "OFF":
+            return np.zeros(n)
+        if self.mode == "CONSTANT":
+            return np.full(n, self.amplitude)
+        return self.current_at_array(t0_ms + dt_ms * np.arange(n))
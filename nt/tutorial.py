@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt, QRect
-from PySide6.QtGui import QPainter, QColor, QPen, QFont
+from PySide6.QtCore import Qt, QRect, QEvent, QPoint
+from PySide6.QtGui import QPainter, QColor, QPen, QFont, QStaticText, QPixmap
 
 
 class TutorialOverlay(QWidget):
@@ -11,6 +11,22 @@ class TutorialOverlay(QWidget):
         self.steps = steps
         self.index = 0
 
+        # per-step highlight rects, composed once and reused by every
+        # paint; a resize of the parent invalidates them
+        self._rect_cache = [None] * len(steps)
+        # pre-rendered dim-with-hole masks keyed by (size, target rect)
+        self._mask_cache = {}
+        parent.installEventFilter(self)
+
+        # shaped once per step: QStaticText memoizes the word-wrapped
+        # glyph layout, so repaints just blit the cached run
+        self._font = QFont("Sans Serif", 10)
+        self._static = []
+        for _, text in steps:
+            st = QStaticText(text + "\n\n(click to continue)")
+            st.setTextFormat(Qt.PlainText)
+            self._static.append(st)
+
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Tool)
         self.setAttribute(Qt.WA_TranslucentBackground, True)
         self.setGeometry(parent.rect())
@@ -28,12 +44,25 @@ class TutorialOverlay(QWidget):
 
     # geometry
 
+    def eventFilter(self, obj, event):
+        if obj is self.parent and event.type() == QEvent.Resize:
+            self._rect_cache = [None] * len(self.steps)
+            self._mask_cache.clear()
+            self.setGeometry(self.parent.rect())
+        return super().eventFilter(obj, event)
+
     def target_rect(self):
         widget, _ = self.steps[self.index]
 
         if widget is None or not widget.isVisible():
             return None
 
+        rect = self._rect_cache[self.index]
+        if rect is not None:
+            return rect
+
+        # walk the ancestor chain once per step and cache the composed
+        # rect; paint events then pay an attribute read, not a Qt traversal
         rect = widget.geometry()
         w = widget.parentWidget()
         while w and w != self.parent:
@@ -46,26 +75,44 @@ class TutorialOverlay(QWidget):
         if rect.height() < 40:
             rect = rect.adjusted(-6, -10, 6, 10)
 
+        self._rect_cache[self.index] = rect
         return rect
 
     # paint
 
+    def _mask_pixmap(self, target):
+        # the dim fill, punched hole and highlight outline only change
+        # with the overlay size or the target rect; render them once into
+        # a pixmap and blit, instead of re-running the clear-composition
+        # pass on a translucent window every frame
+        key = (
+            self.width(), self.height(),
+            (target.x(), target.y(), target.width(), target.height())
+            if target else None,
+        )
+        pm = self._mask_cache.get(key)
+        if pm is None:
+            pm = QPixmap(self.size())
+            pm.fill(Qt.transparent)
+            p = QPainter(pm)
+            p.setRenderHint(QPainter.Antialiasing)
+            p.fillRect(self.rect(), QColor(0, 0, 0, 90))
+            if target:
+                p.setCompositionMode(QPainter.CompositionMode_Clear)
+                p.fillRect(target, Qt.transparent)
+                p.setCompositionMode(QPainter.CompositionMode_SourceOver)
+                p.setPen(QPen(QColor("#9fffba"), 2))
+                p.setBrush(Qt.NoBrush)
+                p.drawRoundedRect(target, 8, 8)
+            p.end()
+            self._mask_cache[key] = pm
+        return pm
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        target = self.target_rect()
-
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 90))
-
-        if target:
-            painter.setCompositionMode(QPainter.CompositionMode_Clear)
-            painter.fillRect(target, Qt.transparent)
-            painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
-
-            painter.setPen(QPen(QColor("#9fffba"), 2))
-            painter.setBrush(Qt.NoBrush)
-            painter.drawRoundedRect(target, 8, 8)
+        painter.drawPixmap(0, 0, self._mask_pixmap(self.target_rect()))
 
         box = QRect(
             40,
@@ -79,11 +126,10 @@ class TutorialOverlay(QWidget):
         painter.drawRoundedRect(box, 12, 12)
 
         painter.setPen(QColor("#d7e1d9"))
-        painter.setFont(QFont("Sans Serif", 10))
+        painter.setFont(self._font)
 
-        _, text = self.steps[self.index]
-        painter.drawText(
-            box.adjusted(16, 14, -16, -14),
-            Qt.TextWordWrap,
-            text + "\n\n(click to continue)"
-        )
+        st = self._static[self.index]
+        avail = box.width() - 32
+        if st.textWidth() != avail:
+            st.setTextWidth(avail)
+        painter.drawStaticText(box.topLeft() + QPoint(16, 14), st)
@@ -0,0 +1,36 @@
+"""Construct-the-window smoke test.
+
+MainWindow wires a lot of state together in __init__ (worker thread,
+plot buffers, log plumbing); this just proves it comes up and tears
+down cleanly, so init-order regressions can't ship silently.
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+pytest.importorskip("PySide6")
+pytest.importorskip("pyqtgraph")
+
+from PySide6.QtWidgets import QApplication
+
+from nt.gui import MainWindow
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+def test_main_window_constructs(qapp):
+    win = MainWindow()
+    try:
+        # construction logs "System initialized." through log(), which
+        # must tolerate the UI still being built
+        assert "System initialized." in win.log_widget.toPlainText()
+        assert not win.running
+    finally:
+        win.close()